@@ -26,6 +26,9 @@ import hmac
 SECRET_KEY = os.getenv("ANALYTICA_SECRET_KEY", "analytica-secret-key-change-in-production")
 TOKEN_EXPIRE_HOURS = int(os.getenv("ANALYTICA_TOKEN_EXPIRE_HOURS", "24"))
 
+# Token signature: truncated hex HMAC-SHA256
+_SIGNATURE_LENGTH = 32
+
 # ============================================================
 # MODELS
 # ============================================================
@@ -88,9 +91,100 @@ class PointsResponse(BaseModel):
 # IN-MEMORY STORAGE (Replace with database in production)
 # ============================================================
 
-_users_db: Dict[str, Dict] = {}
+class UserRecord:
+    """
+    User stored in _users_db.
+    
+    Uses __slots__ instead of a per-user dict. Supports dict-style access
+    (user["points_balance"], user.get(...), user.setdefault(...)) so route
+    handlers and callers can treat it like the plain dict it replaces.
+    """
+    
+    __slots__ = (
+        "id", "email", "name", "company", "password_hash",
+        "points_balance", "plan", "created_at", "transactions"
+    )
+    
+    def __init__(
+        self,
+        id: str,
+        email: str,
+        name: str,
+        password_hash: str,
+        company: Optional[str] = None,
+        points_balance: int = 0,
+        plan: str = "free",
+        created_at: Optional[str] = None,
+        transactions: Optional[list] = None
+    ):
+        self.id = id
+        self.email = email
+        self.name = name
+        self.company = company
+        self.password_hash = password_hash
+        self.points_balance = points_balance
+        self.plan = plan
+        self.created_at = created_at or datetime.utcnow().isoformat()
+        self.transactions = transactions if transactions is not None else []
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in _USER_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in _USER_FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+    
+    def __contains__(self, key: object) -> bool:
+        return key in _USER_FIELDS
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in _USER_FIELDS else default
+    
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        # All fields are always set, so this only validates the key
+        return self[key]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: getattr(self, key) for key in self.__slots__}
+
+
+_USER_FIELDS = frozenset(UserRecord.__slots__)
+
+# Plain dict on purpose: in-memory lookups must stay a single hash probe
+_users_db: Dict[str, UserRecord] = {}
 _sessions_db: Dict[str, Dict] = {}
 
+# email -> user_id index, so register/login do not scan every user
+_email_index: Dict[str, str] = {}
+
+
+def _add_user(user: UserRecord) -> None:
+    """Store user and index it by email"""
+    _users_db[user["id"]] = user
+    _email_index[user["email"]] = user["id"]
+
+
+def _find_user_by_email(email: str) -> Optional[UserRecord]:
+    """Find user by email using the email index, scanning users it does not cover"""
+    user_id = _email_index.get(email)
+    if user_id is not None:
+        user = _users_db.get(user_id)
+        if user is not None and user["email"] == email:
+            return user
+        # Stale index entry (user removed or email changed)
+        del _email_index[email]
+    
+    # Users written straight into _users_db are not indexed yet
+    for user in _users_db.values():
+        if user["email"] == email:
+            _email_index[email] = user["id"]
+            return user
+    
+    return None
+
 
 def _hash_password(password: str) -> str:
     """Hash password with salt"""
@@ -107,19 +201,22 @@ def _generate_token(user_id: str, email: str) -> str:
         "iat": datetime.utcnow().isoformat()
     }
     payload_b64 = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
-    signature = hmac.new(SECRET_KEY.encode(), payload_b64.encode(), hashlib.sha256).hexdigest()[:32]
+    signature = hmac.new(SECRET_KEY.encode(), payload_b64.encode(), hashlib.sha256).hexdigest()[:_SIGNATURE_LENGTH]
     return f"{payload_b64}.{signature}"
 
 
 def _verify_token(token: str) -> Optional[Dict]:
     """Verify and decode token"""
+    # Reject malformed tokens before any HMAC / base64 work
+    if not token or token.count(".") != 1:
+        return None
+    
+    payload_b64, signature = token.split(".", 1)
+    if not payload_b64 or len(signature) != _SIGNATURE_LENGTH:
+        return None
+    
     try:
-        parts = token.split(".")
-        if len(parts) != 2:
-            return None
-        
-        payload_b64, signature = parts
-        expected_sig = hmac.new(SECRET_KEY.encode(), payload_b64.encode(), hashlib.sha256).hexdigest()[:32]
+        expected_sig = hmac.new(SECRET_KEY.encode(), payload_b64.encode(), hashlib.sha256).hexdigest()[:_SIGNATURE_LENGTH]
         
         if not hmac.compare_digest(signature, expected_sig):
             return None
@@ -143,7 +240,7 @@ def _verify_token(token: str) -> Optional[Dict]:
 security = HTTPBearer(auto_error=False)
 
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Dict:
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> UserRecord:
     """Get current authenticated user"""
     if not credentials:
         raise HTTPException(
@@ -170,7 +267,7 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     return user
 
 
-async def get_optional_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Optional[Dict]:
+async def get_optional_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Optional[UserRecord]:
     """Get current user if authenticated, None otherwise"""
     if not credentials:
         return None
@@ -193,27 +290,24 @@ auth_router = APIRouter(prefix="/api/v1/auth", tags=["Authentication"])
 async def register(data: UserRegister):
     """Register a new user"""
     # Check if email exists
-    for user in _users_db.values():
-        if user["email"] == data.email:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
+    if _find_user_by_email(data.email):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
     
     # Create user
     user_id = secrets.token_hex(8)
-    user = {
-        "id": user_id,
-        "email": data.email,
-        "name": data.name,
-        "company": data.company,
-        "password_hash": _hash_password(data.password),
-        "points_balance": 10,  # Free starter points
-        "plan": "free",
-        "created_at": datetime.utcnow().isoformat(),
-        "transactions": []
-    }
-    _users_db[user_id] = user
+    user = UserRecord(
+        id=user_id,
+        email=data.email,
+        name=data.name,
+        company=data.company,
+        password_hash=_hash_password(data.password),
+        points_balance=10,  # Free starter points
+        plan="free"
+    )
+    _add_user(user)
     
     # Generate token
     token = _generate_token(user_id, data.email)
@@ -236,11 +330,7 @@ async def register(data: UserRegister):
 async def login(data: UserLogin):
     """Login user"""
     # Find user by email
-    user = None
-    for u in _users_db.values():
-        if u["email"] == data.email:
-            user = u
-            break
+    user = _find_user_by_email(data.email)
     
     if not user:
         raise HTTPException(
@@ -273,7 +363,7 @@ async def login(data: UserLogin):
 
 
 @auth_router.get("/me", response_model=UserProfile)
-async def get_profile(user: Dict = Depends(get_current_user)):
+async def get_profile(user: UserRecord = Depends(get_current_user)):
     """Get current user profile"""
     return UserProfile(
         id=user["id"],
@@ -287,7 +377,7 @@ async def get_profile(user: Dict = Depends(get_current_user)):
 
 
 @auth_router.get("/points")
-async def get_points(user: Dict = Depends(get_current_user)):
+async def get_points(user: UserRecord = Depends(get_current_user)):
     """Get user points balance"""
     return {
         "user_id": user["id"],
@@ -298,7 +388,7 @@ async def get_points(user: Dict = Depends(get_current_user)):
 
 
 @auth_router.post("/points/purchase", response_model=PointsResponse)
-async def purchase_points(data: PointsPurchase, user: Dict = Depends(get_current_user)):
+async def purchase_points(data: PointsPurchase, user: UserRecord = Depends(get_current_user)):
     """Purchase points"""
     transaction_id = secrets.token_hex(8)
     
@@ -325,7 +415,7 @@ async def purchase_points(data: PointsPurchase, user: Dict = Depends(get_current
 
 
 @auth_router.post("/points/use")
-async def use_points(amount: int = 1, user: Dict = Depends(get_current_user)):
+async def use_points(amount: int = 1, user: UserRecord = Depends(get_current_user)):
     """Use points for an operation"""
     if user["points_balance"] < amount:
         raise HTTPException(
@@ -354,7 +444,7 @@ async def use_points(amount: int = 1, user: Dict = Depends(get_current_user)):
 
 
 @auth_router.post("/logout")
-async def logout(user: Dict = Depends(get_current_user)):
+async def logout(user: UserRecord = Depends(get_current_user)):
     """Logout user (invalidate session)"""
     return {"success": True, "message": "Logged out successfully"}
 
@@ -367,17 +457,15 @@ def create_demo_user():
     """Create demo user for testing"""
     demo_id = "demo_user_001"
     if demo_id not in _users_db:
-        _users_db[demo_id] = {
-            "id": demo_id,
-            "email": "demo@analytica.pl",
-            "name": "Demo User",
-            "company": "Analytica Demo",
-            "password_hash": _hash_password("demo123"),
-            "points_balance": 100,
-            "plan": "pro",
-            "created_at": datetime.utcnow().isoformat(),
-            "transactions": []
-        }
+        _add_user(UserRecord(
+            id=demo_id,
+            email="demo@analytica.pl",
+            name="Demo User",
+            company="Analytica Demo",
+            password_hash=_hash_password("demo123"),
+            points_balance=100,
+            plan="pro"
+        ))
 
 # Create demo user on module load
 create_demo_user()
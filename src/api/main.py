@@ -38,6 +38,7 @@ from dsl.core.parser import (
 from dsl.atoms import implementations as _dsl_atoms
 from dsl.atoms import deploy as _dsl_atoms_deploy
 from dsl.atoms import data as _dsl_atoms_data
+from dsl.api.responses import FastJSONResponse
 from api.auth import auth_router, get_current_user, get_optional_user
 
 # ============================================================
@@ -59,6 +60,7 @@ app = FastAPI(
     title=f"ANALYTICA API - {DOMAIN}",
     description=f"Analytics API for {DOMAIN}",
     version="2.0.0",
+    default_response_class=FastJSONResponse,
 )
 
 _src_dir = Path(__file__).resolve().parent.parent
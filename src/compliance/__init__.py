@@ -20,6 +20,12 @@ Planowane (do dodania):
 - AI Act - regulacje AI (2025-2026)
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from decimal import Decimal
+from operator import itemgetter
+from typing import Optional
+
 # KSeF - Polski system e-faktur
 from .ksef import (
     KSeFEnvironment,
@@ -133,125 +139,155 @@ class ComplianceChecker:
         self.revenue_eur = revenue_eur
         self.is_listed = is_listed
     
-    def check_all(self) -> dict:
-        """Sprawdź wszystkie regulacje"""
-        from datetime import date
-        from decimal import Decimal
+    def check_all(self, check_date: Optional[date] = None, parallel: bool = False) -> dict:
+        """
+        Sprawdź wszystkie regulacje (na dzień check_date, domyślnie dziś)
         
-        results = {
-            "company": self.company_name,
-            "check_date": date.today().isoformat(),
-            "regulations": {}
+        Sprawdzenia są od siebie niezależne. Przy parallel=True uruchamiane
+        są w puli wątków - opłaca się, gdy sprawdzenia wykonują I/O
+        (baza reguł, API rejestrów); dla obliczeń w pamięci sekwencyjne
+        wykonanie jest szybsze.
+        """
+        # Jedna data dla wszystkich sprawdzeń
+        today = check_date or date.today()
+        
+        checks = {
+            "ksef": self._check_ksef,
+            "edoreczenia": self._check_edoreczenia,
+            "csrd": self._check_csrd,
+            "cbam": self._check_cbam,
+            "vida": self._check_vida,
         }
         
-        # KSeF
-        results["regulations"]["ksef"] = {
+        if parallel:
+            with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+                futures = {name: executor.submit(check, today) for name, check in checks.items()}
+                outcomes = {name: future.result() for name, future in futures.items()}
+        else:
+            outcomes = {name: check(today) for name, check in checks.items()}
+        
+        return {
+            "company": self.company_name,
+            "check_date": today.isoformat(),
+            "regulations": {
+                name: outcome for name, outcome in outcomes.items() if outcome is not None
+            }
+        }
+    
+    def _check_ksef(self, today: date) -> dict:
+        """KSeF"""
+        return {
             "name": "Krajowy System e-Faktur",
             "mandatory_from": "2026-02-01",
             "status": "PREPARE",
             "priority": "HIGH" if self.country == "PL" else "N/A"
         }
+    
+    def _check_edoreczenia(self, today: date) -> Optional[dict]:
+        """E-Doręczenia (tylko PL)"""
+        if self.country != "PL":
+            return None
         
-        # E-Doręczenia
-        if self.country == "PL":
-            ed_check = EDoreczeniaComplianceChecker.check_compliance(
-                entity_type="KRS",  # Assumption
-                has_ade=False
-            )
-            results["regulations"]["edoreczenia"] = {
-                "name": "E-Doręczenia",
-                **ed_check
-            }
-        
-        # CSRD
+        ed_check = EDoreczeniaComplianceChecker.check_compliance(
+            entity_type="KRS",  # Assumption
+            has_ade=False,
+            check_date=today
+        )
+        return {
+            "name": "E-Doręczenia",
+            **ed_check
+        }
+    
+    def _check_csrd(self, today: date) -> dict:
+        """CSRD"""
         csrd_size = CSRDComplianceChecker.determine_entity_size(
             employees=self.employees,
             revenue_eur=Decimal(str(self.revenue_eur)),
             assets_eur=Decimal(str(self.revenue_eur * 0.5)),  # Estimate
             is_listed=self.is_listed
         )
-        csrd_check = CSRDComplianceChecker.check_compliance(csrd_size)
-        results["regulations"]["csrd"] = {
+        csrd_check = CSRDComplianceChecker.check_compliance(csrd_size, check_date=today)
+        return {
             "name": "CSRD / ESG Reporting",
             **csrd_check
         }
-        
-        # CBAM
-        results["regulations"]["cbam"] = {
+    
+    def _check_cbam(self, today: date) -> dict:
+        """CBAM"""
+        return {
             "name": "Carbon Border Adjustment Mechanism",
-            "phase": CBAMComplianceChecker.get_current_phase().value,
+            "phase": CBAMComplianceChecker.get_current_phase(today).value,
             "applicable": "Check imports",
             "quarterly_reporting": True
         }
-        
-        # ViDA
+    
+    def _check_vida(self, today: date) -> dict:
+        """ViDA"""
         vida_check = ViDAComplianceChecker.check_e_invoicing_readiness(
             has_einvoicing_system=False,
-            ksef_ready=False
+            ksef_ready=False,
+            check_date=today
         )
-        results["regulations"]["vida"] = {
+        return {
             "name": "VAT in Digital Age",
             **vida_check
         }
-        
-        return results
     
-    def get_timeline(self) -> list:
-        """Pobierz harmonogram wdrożeń"""
-        from datetime import date
-        
-        timeline = [
-            {
-                "date": "2025-01-01",
-                "regulation": "CSRD",
-                "description": "Raportowanie ESG dla dużych spółek giełdowych",
-                "action": "Przygotuj pierwszy raport ESG za 2024"
-            },
-            {
-                "date": "2026-01-01",
-                "regulation": "E-Doręczenia",
-                "description": "Obowiązkowe e-Doręczenia dla firm",
-                "action": "Zarejestruj adres ADE w BAE"
-            },
-            {
-                "date": "2026-01-01",
-                "regulation": "CBAM",
-                "description": "Pełne wdrożenie CBAM - certyfikaty",
-                "action": "Przygotuj zakup certyfikatów CBAM"
-            },
-            {
-                "date": "2026-02-01",
-                "regulation": "KSeF",
-                "description": "Obowiązkowy KSeF w Polsce",
-                "action": "Wdróż integrację z KSeF"
-            },
-            {
-                "date": "2026-01-01",
-                "regulation": "CSRD",
-                "description": "Raportowanie ESG dla dużych przedsiębiorstw",
-                "action": "Raport za 2025 wg ESRS"
-            },
-            {
-                "date": "2028-01-01",
-                "regulation": "ViDA",
-                "description": "E-fakturowanie wewnątrzunijne",
-                "action": "Przygotuj systemy na e-fakturowanie UE"
-            },
-        ]
-        
-        today = date.today()
+    # Harmonogram wdrożeń: (data, regulacja, opis, działanie)
+    TIMELINE = (
+        ("2025-01-01", "CSRD",
+         "Raportowanie ESG dla dużych spółek giełdowych",
+         "Przygotuj pierwszy raport ESG za 2024"),
+        ("2026-01-01", "E-Doręczenia",
+         "Obowiązkowe e-Doręczenia dla firm",
+         "Zarejestruj adres ADE w BAE"),
+        ("2026-01-01", "CBAM",
+         "Pełne wdrożenie CBAM - certyfikaty",
+         "Przygotuj zakup certyfikatów CBAM"),
+        ("2026-02-01", "KSeF",
+         "Obowiązkowy KSeF w Polsce",
+         "Wdróż integrację z KSeF"),
+        ("2026-01-01", "CSRD",
+         "Raportowanie ESG dla dużych przedsiębiorstw",
+         "Raport za 2025 wg ESRS"),
+        ("2028-01-01", "ViDA",
+         "E-fakturowanie wewnątrzunijne",
+         "Przygotuj systemy na e-fakturowanie UE"),
+    )
+    
+    def get_timeline(self, check_date: Optional[date] = None) -> list:
+        """Pobierz harmonogram wdrożeń (statusy na dzień check_date, domyślnie dziś)"""
+        today = check_date or date.today()
+        timeline = []
         
-        # Dodaj status
-        for item in timeline:
-            item_date = date.fromisoformat(item["date"])
+        for item_date, regulation, description, action in _SORTED_TIMELINE:
+            # Dodaj status
             if item_date <= today:
-                item["status"] = "ACTIVE"
+                item_status = "ACTIVE"
             elif (item_date - today).days <= 365:
-                item["status"] = "UPCOMING"
+                item_status = "UPCOMING"
             else:
-                item["status"] = "FUTURE"
+                item_status = "FUTURE"
+            
+            timeline.append({
+                "date": item_date.isoformat(),
+                "regulation": regulation,
+                "description": description,
+                "action": action,
+                "status": item_status
+            })
         
-        return sorted(timeline, key=lambda x: x["date"])
+        return timeline
+
+
+# Harmonogram posortowany raz przy imporcie (sortowanie stabilne po dacie)
+_SORTED_TIMELINE = tuple(sorted(
+    (
+        (date.fromisoformat(item_date), regulation, description, action)
+        for item_date, regulation, description, action in ComplianceChecker.TIMELINE
+    ),
+    key=itemgetter(0)
+))
 
 
 __all__ = [
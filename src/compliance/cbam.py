@@ -73,6 +73,25 @@ CBAM_CN_CODES = {
     ]
 }
 
+# Indeks prefiks CN -> kategoria (budowany raz przy imporcie)
+_CN_CODE_INDEX: Dict[str, CBAMProduct] = {
+    code: cat for cat, codes in CBAM_CN_CODES.items() for code in codes
+}
+
+# Długości prefiksów w indeksie, od najdłuższej (najbardziej szczegółowy kod wygrywa)
+_CN_PREFIX_LENGTHS = sorted({len(code) for code in _CN_CODE_INDEX}, reverse=True)
+
+
+def _lookup_cn_code(cn_code: str) -> Optional[CBAMProduct]:
+    """Znajdź kategorię CBAM dla kodu CN (dopasowanie prefiksu)"""
+    for length in _CN_PREFIX_LENGTHS:
+        if len(cn_code) >= length:
+            category = _CN_CODE_INDEX.get(cn_code[:length])
+            if category is not None:
+                return category
+    return None
+
+
 # Domyślne współczynniki emisji (tCO2/t produktu)
 DEFAULT_EMISSION_FACTORS = {
     CBAMProduct.CEMENT: Decimal("0.766"),
@@ -334,11 +353,7 @@ class CBAMCalculator:
     ) -> Dict:
         """Oblicz emisje dla importu"""
         # Znajdź kategorię produktu
-        product_category = None
-        for cat, codes in CBAM_CN_CODES.items():
-            if any(cn_code.startswith(code) for code in codes):
-                product_category = cat
-                break
+        product_category = _lookup_cn_code(cn_code)
         
         if not product_category:
             return {
@@ -369,18 +384,12 @@ class CBAMCalculator:
     @classmethod
     def is_cbam_product(cls, cn_code: str) -> bool:
         """Sprawdź czy produkt jest objęty CBAM"""
-        for codes in CBAM_CN_CODES.values():
-            if any(cn_code.startswith(code) for code in codes):
-                return True
-        return False
+        return _lookup_cn_code(cn_code) is not None
     
     @classmethod
     def get_product_category(cls, cn_code: str) -> Optional[CBAMProduct]:
         """Pobierz kategorię produktu CBAM"""
-        for cat, codes in CBAM_CN_CODES.items():
-            if any(cn_code.startswith(code) for code in codes):
-                return cat
-        return None
+        return _lookup_cn_code(cn_code)
 
 
 # ============================================================
@@ -404,9 +413,9 @@ class CBAMComplianceChecker:
     }
     
     @classmethod
-    def get_current_phase(cls) -> CBAMPhase:
-        """Pobierz aktualną fazę CBAM"""
-        today = date.today()
+    def get_current_phase(cls, check_date: Optional[date] = None) -> CBAMPhase:
+        """Pobierz fazę CBAM na dzień check_date (domyślnie dziś)"""
+        today = check_date or date.today()
         
         if today < cls.FULL_START:
             return CBAMPhase.TRANSITIONAL
@@ -418,7 +427,8 @@ class CBAMComplianceChecker:
         year: int,
         quarter: int,
         report_submitted: bool = False,
-        submission_date: Optional[date] = None
+        submission_date: Optional[date] = None,
+        check_date: Optional[date] = None
     ) -> Dict:
         """Sprawdź zgodność raportu kwartalnego"""
         # Oblicz deadline
@@ -430,7 +440,7 @@ class CBAMComplianceChecker:
             deadline_month, deadline_day = cls.QUARTERLY_DEADLINES[quarter + 1]
         
         deadline = date(deadline_year, deadline_month, deadline_day)
-        today = date.today()
+        today = check_date or date.today()
         
         # Status
         is_overdue = not report_submitted and today > deadline
@@ -446,7 +456,7 @@ class CBAMComplianceChecker:
             "is_on_time": is_on_time,
             "days_to_deadline": (deadline - today).days if today <= deadline else 0,
             "days_overdue": (today - deadline).days if is_overdue else 0,
-            "phase": cls.get_current_phase().value,
+            "phase": cls.get_current_phase(today).value,
             "recommendations": cls._get_quarterly_recommendations(
                 report_submitted, is_overdue, deadline
             )
@@ -458,12 +468,13 @@ class CBAMComplianceChecker:
         year: int,
         declaration_submitted: bool = False,
         certificates_surrendered: int = 0,
-        certificates_required: int = 0
+        certificates_required: int = 0,
+        check_date: Optional[date] = None
     ) -> Dict:
         """Sprawdź zgodność rocznej deklaracji (od 2026)"""
         # Deadline: 31 maja następnego roku
         deadline = date(year + 1, 5, 31)
-        today = date.today()
+        today = check_date or date.today()
         
         # Sprawdź czy CBAM w pełni obowiązuje
         if year < 2026:
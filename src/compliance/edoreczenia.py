@@ -22,6 +22,7 @@ from abc import ABC, abstractmethod
 import base64
 import hashlib
 import json
+import re
 
 import httpx
 
@@ -63,6 +64,10 @@ class RecipientType(Enum):
     PUBLIC_ENTITY = "PUBLIC"       # Podmiot publiczny
 
 
+# Format adresu ADE: AE:PL-XXXXX-XXXXX-XXXXX-XX (X - cyfra lub wielka litera)
+_ADE_PATTERN = re.compile(r"AE:PL-[0-9A-Z]{5}-[0-9A-Z]{5}-[0-9A-Z]{5}-[0-9A-Z]{2}")
+
+
 # ============================================================
 # DATA MODELS
 # ============================================================
@@ -88,7 +93,7 @@ class EDoreczeniaAddress:
         
         if not self.ade:
             errors.append("Adres ADE jest wymagany")
-        elif not self.ade.startswith("AE:PL-"):
+        elif not _ADE_PATTERN.fullmatch(self.ade):
             errors.append("Nieprawidłowy format adresu ADE")
         
         if not self.name:
@@ -629,13 +634,14 @@ class EDoreczeniaComplianceChecker:
     def check_compliance(
         entity_type: str,  # PUBLIC, CEIDG, KRS, OTHER
         has_ade: bool,
-        ade_active: bool = False
+        ade_active: bool = False,
+        check_date: Optional[date] = None
     ) -> Dict:
-        """Sprawdź zgodność podmiotu"""
+        """Sprawdź zgodność podmiotu (na dzień check_date, domyślnie dziś)"""
         mandatory_types = ["PUBLIC", "CEIDG", "KRS"]
         is_mandatory = entity_type.upper() in mandatory_types
         
-        today = date.today()
+        today = check_date or date.today()
         deadline_passed = today >= EDoreczeniaComplianceChecker.MANDATORY_DATE
         
         compliant = not is_mandatory or (has_ade and ade_active)
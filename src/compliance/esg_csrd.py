@@ -23,6 +23,8 @@ from dataclasses import dataclass, field
 from datetime import datetime, date
 from decimal import Decimal
 from enum import Enum
+from itertools import compress
+from operator import attrgetter
 import json
 
 
@@ -324,45 +326,40 @@ class ESGReport:
     
     def get_esg_score(self) -> Dict[str, Decimal]:
         """Oblicz uproszczony score ESG"""
-        scores = {}
-        
-        # E score (0-100)
-        e_score = Decimal("50")
-        if self.environmental.emissions:
-            latest = max(self.environmental.emissions, key=lambda x: x.year)
-            if latest.verified:
-                e_score += Decimal("10")
-        if self.environmental.science_based_targets:
-            e_score += Decimal("15")
-        if self.environmental.net_zero_target_year:
-            e_score += Decimal("10")
-        scores["E"] = min(e_score, Decimal("100"))
-        
-        # S score (0-100)
-        s_score = Decimal("50")
-        if self.social.workforce:
-            latest = max(self.social.workforce, key=lambda x: x.year)
-            if latest.female_management_percentage >= 30:
-                s_score += Decimal("10")
-            if latest.gender_pay_gap and latest.gender_pay_gap < 5:
-                s_score += Decimal("10")
-        if self.social.human_rights_policy:
-            s_score += Decimal("10")
-        scores["S"] = min(s_score, Decimal("100"))
-        
-        # G score (0-100)
-        g_score = Decimal("50")
-        if self.governance.board:
-            latest = max(self.governance.board, key=lambda x: x.year)
-            if latest.independent_members / latest.total_members >= 0.5:
-                g_score += Decimal("15")
-            if latest.sustainability_committee:
-                g_score += Decimal("10")
-        if self.governance.ethics:
-            latest = max(self.governance.ethics, key=lambda x: x.year)
-            if latest.corruption_incidents == 0:
-                g_score += Decimal("10")
-        scores["G"] = min(g_score, Decimal("100"))
+        env = self.environmental
+        social = self.social
+        gov = self.governance
+        
+        # E: zweryfikowane emisje, SBT, cel net zero
+        latest_emission = max(env.emissions, key=attrgetter("year")) if env.emissions else None
+        e_flags = (
+            latest_emission is not None and latest_emission.verified,
+            env.science_based_targets,
+            env.net_zero_target_year,
+        )
+        
+        # S: kobiety w zarządzaniu, luka płacowa, polityka praw człowieka
+        latest_workforce = max(social.workforce, key=attrgetter("year")) if social.workforce else None
+        s_flags = (
+            latest_workforce is not None and latest_workforce.female_management_percentage >= 30,
+            latest_workforce is not None and latest_workforce.gender_pay_gap and latest_workforce.gender_pay_gap < 5,
+            social.human_rights_policy,
+        )
+        
+        # G: niezależność zarządu, komitet ESG, brak incydentów korupcyjnych
+        latest_board = max(gov.board, key=attrgetter("year")) if gov.board else None
+        latest_ethics = max(gov.ethics, key=attrgetter("year")) if gov.ethics else None
+        g_flags = (
+            latest_board is not None and latest_board.independent_members / latest_board.total_members >= 0.5,
+            latest_board is not None and latest_board.sustainability_committee,
+            latest_ethics is not None and latest_ethics.corruption_incidents == 0,
+        )
+        
+        scores = {
+            "E": _pillar_score(_E_SCORE_WEIGHTS, e_flags),
+            "S": _pillar_score(_S_SCORE_WEIGHTS, s_flags),
+            "G": _pillar_score(_G_SCORE_WEIGHTS, g_flags),
+        }
         
         # Total
         scores["Total"] = (scores["E"] + scores["S"] + scores["G"]) / 3
@@ -370,6 +367,19 @@ class ESGReport:
         return scores
 
 
+# Wagi score ESG - kolejność zgodna z flagami w ESGReport.get_esg_score
+_ESG_BASE_SCORE = Decimal("50")
+_ESG_MAX_SCORE = Decimal("100")
+_E_SCORE_WEIGHTS = (Decimal("10"), Decimal("15"), Decimal("10"))
+_S_SCORE_WEIGHTS = (Decimal("10"), Decimal("10"), Decimal("10"))
+_G_SCORE_WEIGHTS = (Decimal("15"), Decimal("10"), Decimal("10"))
+
+
+def _pillar_score(weights: Tuple[Decimal, ...], flags: Tuple[Any, ...]) -> Decimal:
+    """Score filaru (0-100): bazowe 50 + wagi spełnionych kryteriów"""
+    return min(sum(compress(weights, flags), _ESG_BASE_SCORE), _ESG_MAX_SCORE)
+
+
 # ============================================================
 # CSRD COMPLIANCE CHECKER
 # ============================================================
@@ -445,9 +455,10 @@ class CSRDComplianceChecker:
         has_report: bool = False,
         report_year: Optional[int] = None,
         esrs_applied: List[ESRSStandard] = None,
-        externally_assured: bool = False
+        externally_assured: bool = False,
+        check_date: Optional[date] = None
     ) -> Dict:
-        """Sprawdź zgodność z CSRD"""
+        """Sprawdź zgodność z CSRD (na dzień check_date, domyślnie dziś)"""
         thresholds = cls.THRESHOLDS.get(entity_size)
         
         if not thresholds:
@@ -458,7 +469,7 @@ class CSRDComplianceChecker:
                 "message": "Raportowanie CSRD nie jest obowiązkowe dla tej kategorii podmiotu"
             }
         
-        today = date.today()
+        today = check_date or date.today()
         mandatory_from = thresholds["mandatory_from"]
         first_report_year = thresholds["first_report_year"]
         
@@ -530,6 +541,10 @@ class CSRDComplianceChecker:
 # CARBON CALCULATOR
 # ============================================================
 
+# Dokładność raportowania emisji (tCO2e)
+_TONNES_QUANTUM = Decimal("0.01")
+
+
 class CarbonCalculator:
     """Kalkulator śladu węglowego"""
     
@@ -559,6 +574,29 @@ class CarbonCalculator:
         "concrete": Decimal("0.103"),
     }
     
+    # Domyślny współczynnik dla nieznanego typu paliwa (per km)
+    DEFAULT_VEHICLE_FACTOR = Decimal("0.17")
+    
+    @classmethod
+    def _scope1_kg(
+        cls,
+        natural_gas_kwh: Decimal,
+        heating_oil_kwh: Decimal,
+        company_vehicles_km: Optional[Dict[str, Decimal]]
+    ) -> Decimal:
+        """Emisje Scope 1 w kg CO2e"""
+        total = (
+            natural_gas_kwh * cls.EMISSION_FACTORS["natural_gas"]
+            + heating_oil_kwh * cls.EMISSION_FACTORS["heating_oil"]
+        )
+        
+        if company_vehicles_km:
+            for fuel_type, km in company_vehicles_km.items():
+                factor = cls.EMISSION_FACTORS.get(f"car_{fuel_type}", cls.DEFAULT_VEHICLE_FACTOR)
+                total += km * factor
+        
+        return total
+    
     @classmethod
     def calculate_scope1(
         cls,
@@ -567,28 +605,44 @@ class CarbonCalculator:
         company_vehicles_km: Dict[str, Decimal] = None
     ) -> GHGEmission:
         """Oblicz emisje Scope 1 (bezpośrednie)"""
-        total = Decimal("0")
-        
-        # Gaz
-        total += natural_gas_kwh * cls.EMISSION_FACTORS["natural_gas"]
-        
-        # Olej
-        total += heating_oil_kwh * cls.EMISSION_FACTORS["heating_oil"]
-        
-        # Pojazdy
-        if company_vehicles_km:
-            for fuel_type, km in company_vehicles_km.items():
-                factor = cls.EMISSION_FACTORS.get(f"car_{fuel_type}", Decimal("0.17"))
-                total += km * factor
+        total = cls._scope1_kg(natural_gas_kwh, heating_oil_kwh, company_vehicles_km)
         
         return GHGEmission(
             scope=EmissionScope.SCOPE_1,
-            amount_tonnes_co2e=(total / 1000).quantize(Decimal("0.01")),
+            amount_tonnes_co2e=(total / 1000).quantize(_TONNES_QUANTUM),
             year=date.today().year,
             source="ANALYTICA Carbon Calculator",
             methodology="GHG Protocol"
         )
     
+    @classmethod
+    def calculate_scope1_batch(cls, sites: List[Dict[str, Any]]) -> List[GHGEmission]:
+        """
+        Oblicz emisje Scope 1 dla wielu lokalizacji
+        
+        Każda lokalizacja to dict z kluczami jak w calculate_scope1
+        (natural_gas_kwh, heating_oil_kwh, company_vehicles_km).
+        """
+        year = date.today().year
+        zero = Decimal("0")
+        
+        return [
+            GHGEmission(
+                scope=EmissionScope.SCOPE_1,
+                amount_tonnes_co2e=(
+                    cls._scope1_kg(
+                        site.get("natural_gas_kwh", zero),
+                        site.get("heating_oil_kwh", zero),
+                        site.get("company_vehicles_km")
+                    ) / 1000
+                ).quantize(_TONNES_QUANTUM),
+                year=year,
+                source="ANALYTICA Carbon Calculator",
+                methodology="GHG Protocol"
+            )
+            for site in sites
+        ]
+    
     @classmethod
     def calculate_scope2(
         cls,
@@ -606,7 +660,7 @@ class CarbonCalculator:
         
         return GHGEmission(
             scope=EmissionScope.SCOPE_2,
-            amount_tonnes_co2e=(total / 1000).quantize(Decimal("0.01")),
+            amount_tonnes_co2e=(total / 1000).quantize(_TONNES_QUANTUM),
             year=date.today().year,
             source="ANALYTICA Carbon Calculator",
             methodology="GHG Protocol - Location-based"
@@ -630,7 +684,7 @@ class CarbonCalculator:
         
         return GHGEmission(
             scope=EmissionScope.SCOPE_3,
-            amount_tonnes_co2e=(total / 1000).quantize(Decimal("0.01")),
+            amount_tonnes_co2e=(total / 1000).quantize(_TONNES_QUANTUM),
             year=date.today().year,
             source="ANALYTICA Carbon Calculator - Business Travel",
             methodology="GHG Protocol"
@@ -16,7 +16,7 @@ Dokumentacja: https://www.podatki.gov.pl/ksef/
 Schema: FA(2) - Faktura ustrukturyzowana v2
 """
 
-from typing import Any, Dict, List, Optional, Union, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, date
 from decimal import Decimal
@@ -281,6 +281,24 @@ class KSeFXMLGenerator:
     
     def generate(self, invoice: KSeFInvoice) -> str:
         """Generuj XML faktury"""
+        root = self._build(invoice, datetime.now().isoformat())
+        return ET.tostring(root, encoding="unicode", xml_declaration=True)
+    
+    def generate_many(self, invoices: Iterable[KSeFInvoice]) -> Iterator[str]:
+        """
+        Generuj XML dla wielu faktur (leniwie, faktura po fakturze)
+        
+        Każda faktura to osobny dokument XML - generator nie trzyma
+        całej partii w pamięci. Znacznik czasu wytworzenia jest wspólny
+        dla partii.
+        """
+        created_at = datetime.now().isoformat()
+        for invoice in invoices:
+            root = self._build(invoice, created_at)
+            yield ET.tostring(root, encoding="unicode", xml_declaration=True)
+    
+    def _build(self, invoice: KSeFInvoice, created_at: str) -> ET.Element:
+        """Zbuduj drzewo XML faktury"""
         # Root element
         root = ET.Element("Faktura")
         root.set("xmlns", self.NAMESPACE)
@@ -290,7 +308,7 @@ class KSeFXMLGenerator:
         naglowek = ET.SubElement(root, "Naglowek")
         ET.SubElement(naglowek, "KodFormularza").text = "FA"
         ET.SubElement(naglowek, "WariantFormularza").text = "2"
-        ET.SubElement(naglowek, "DataWytworzeniaFa").text = datetime.now().isoformat()
+        ET.SubElement(naglowek, "DataWytworzeniaFa").text = created_at
         ET.SubElement(naglowek, "SystemInfo").text = "ANALYTICA"
         
         # Podmiot1 - Sprzedawca
@@ -354,7 +372,7 @@ class KSeFXMLGenerator:
         if invoice.notes:
             ET.SubElement(fa, "DodatkowyOpis").text = invoice.notes
         
-        return ET.tostring(root, encoding="unicode", xml_declaration=True)
+        return root
     
     def _add_party(self, parent: ET.Element, party: KSeFParty, role: str):
         """Dodaj dane podmiotu"""
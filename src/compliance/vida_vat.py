@@ -115,6 +115,29 @@ EU_VAT_RATES = {
     EUCountry.SE: Decimal("25"),
 }
 
+# Stawka domyślna dla krajów spoza tabeli
+DEFAULT_VAT_RATE = Decimal("20")
+
+# Płaska tabela stawek po kodzie kraju (hash str zamiast hash enuma w Pythonie)
+_VAT_RATES: Dict[str, Decimal] = {c.name: rate for c, rate in EU_VAT_RATES.items()}
+
+# Stałe Decimal używane w obliczeniach (bez parsowania przy każdym wywołaniu)
+_D_ONE = Decimal("1")
+_D_HUNDRED = Decimal("100")
+_CENT = Decimal("0.01")
+
+# Stawka jako mnożnik (rate / 100) - bez dzielenia Decimal przy każdej transakcji
+_VAT_MULTIPLIERS: Dict[str, Decimal] = {
+    code: rate / _D_HUNDRED for code, rate in _VAT_RATES.items()
+}
+
+# Mnożnik brutto (1 + rate / 100) - kwota brutto to jedno mnożenie
+_GROSS_FACTORS: Dict[str, Decimal] = {
+    code: _D_ONE + multiplier for code, multiplier in _VAT_MULTIPLIERS.items()
+}
+_DEFAULT_VAT_MULTIPLIER = DEFAULT_VAT_RATE / _D_HUNDRED
+_DEFAULT_GROSS_FACTOR = _D_ONE + _DEFAULT_VAT_MULTIPLIER
+
 
 # ============================================================
 # DATA MODELS
@@ -131,7 +154,7 @@ class VATRegistration:
     oss_registration: bool = False
     ioss_registration: bool = False
     
-    def is_valid(self, check_date: date = None) -> bool:
+    def is_valid(self, check_date: Optional[date] = None) -> bool:
         """Sprawdź czy rejestracja jest ważna"""
         check_date = check_date or date.today()
         
@@ -258,7 +281,17 @@ class EUVATCalculator:
     @classmethod
     def get_vat_rate(cls, country: EUCountry) -> Decimal:
         """Pobierz stawkę VAT dla kraju"""
-        return EU_VAT_RATES.get(country, Decimal("20"))
+        return _VAT_RATES.get(country.name, DEFAULT_VAT_RATE)
+    
+    @classmethod
+    def get_vat_multiplier(cls, country: EUCountry) -> Decimal:
+        """Pobierz stawkę VAT jako mnożnik kwoty netto (np. 0.23)"""
+        return _VAT_MULTIPLIERS.get(country.name, _DEFAULT_VAT_MULTIPLIER)
+    
+    @classmethod
+    def get_gross_factor(cls, country: EUCountry) -> Decimal:
+        """Pobierz mnożnik kwoty brutto (np. 1.23)"""
+        return _GROSS_FACTORS.get(country.name, _DEFAULT_GROSS_FACTOR)
     
     @classmethod
     def calculate_vat(
@@ -300,6 +333,8 @@ class EUVATCalculator:
             # B2C - miejsce opodatkowania zależy od progu
             # Uproszczenie: zakładamy przekroczenie progu
             vat_rate = cls.get_vat_rate(buyer_eu_country)
+            vat_multiplier = cls.get_vat_multiplier(buyer_eu_country)
+            gross_factor = cls.get_gross_factor(buyer_eu_country)
             country_of_taxation = buyer_eu_country
             scheme = VATScheme.OSS if seller_country != buyer_eu_country else VATScheme.STANDARD
         else:
@@ -318,17 +353,19 @@ class EUVATCalculator:
             else:
                 # Lokalna sprzedaż lub brak VAT nabywcy
                 vat_rate = cls.get_vat_rate(seller_country)
+                vat_multiplier = cls.get_vat_multiplier(seller_country)
+                gross_factor = cls.get_gross_factor(seller_country)
                 country_of_taxation = seller_country
                 scheme = VATScheme.STANDARD
         
-        vat_amount = net_amount * vat_rate / 100
-        gross_amount = net_amount + vat_amount
+        vat_amount = net_amount * vat_multiplier
+        gross_amount = net_amount * gross_factor
         
         return {
             "net_amount": float(net_amount),
             "vat_rate": float(vat_rate),
-            "vat_amount": float(vat_amount.quantize(Decimal("0.01"))),
-            "gross_amount": float(gross_amount.quantize(Decimal("0.01"))),
+            "vat_amount": float(vat_amount.quantize(_CENT)),
+            "gross_amount": float(gross_amount.quantize(_CENT)),
             "scheme": scheme.value if isinstance(scheme, VATScheme) else scheme,
             "country_of_taxation": country_of_taxation.name if country_of_taxation else None,
             "reverse_charge": False
@@ -399,17 +436,22 @@ class ViDAComplianceChecker:
         "full_implementation": date(2030, 1, 1)
     }
     
+    # Progi DAC7
+    DAC7_SELLERS_THRESHOLD = 30
+    DAC7_GMV_THRESHOLD_EUR = Decimal("2000000")
+    
     @classmethod
     def check_e_invoicing_readiness(
         cls,
         has_einvoicing_system: bool = False,
         ksef_ready: bool = False,  # Polski KSeF
         peppol_ready: bool = False,
-        structured_invoice_format: Optional[str] = None  # UBL, CII
+        structured_invoice_format: Optional[str] = None,  # UBL, CII
+        check_date: Optional[date] = None
     ) -> Dict:
-        """Sprawdź gotowość do e-fakturowania"""
+        """Sprawdź gotowość do e-fakturowania (na dzień check_date, domyślnie dziś)"""
         mandatory_date = cls.VIDA_TIMELINE["digital_reporting"]
-        today = date.today()
+        today = check_date or date.today()
         
         readiness_score = 0
         if has_einvoicing_system:
@@ -478,8 +520,8 @@ class ViDAComplianceChecker:
         
         # DAC7 thresholds
         dac7_applicable = (
-            sellers_count >= 30 or
-            annual_gmv_eur >= Decimal("2000000")
+            sellers_count >= cls.DAC7_SELLERS_THRESHOLD or
+            annual_gmv_eur >= cls.DAC7_GMV_THRESHOLD_EUR
         )
         
         return {
@@ -495,8 +537,8 @@ class ViDAComplianceChecker:
             "dac7_obligations": {
                 "reporting_required": dac7_applicable,
                 "deadline": "January 31 of following year",
-                "threshold_sellers": 30,
-                "threshold_gmv_eur": 2000000
+                "threshold_sellers": cls.DAC7_SELLERS_THRESHOLD,
+                "threshold_gmv_eur": int(cls.DAC7_GMV_THRESHOLD_EUR)
             },
             "recommendations": cls._get_platform_recommendations(
                 is_platform, dac7_applicable
@@ -645,6 +687,7 @@ __all__ = [
     'TransactionType',
     'EUCountry',
     'EU_VAT_RATES',
+    'DEFAULT_VAT_RATE',
     'VATRegistration',
     'VATTransaction',
     'OSSDeclaration',
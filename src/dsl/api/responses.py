@@ -0,0 +1,68 @@
+"""
+ANALYTICA DSL - API Responses
+=============================
+JSON response class shared by the REST servers.
+"""
+
+from math import isfinite
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # orjson is in requirements.txt; stdlib json is the fallback
+    orjson = None
+
+
+# Leaf types orjson writes exactly like JSONResponse; floats are checked separately
+_ORJSON_EXACT_TYPES = frozenset({str, int, bool, type(None)})
+
+
+def _orjson_matches_json(content: Any) -> bool:
+    """Whether orjson output for content is byte-identical to JSONResponse.
+
+    Rejects non-finite floats (JSONResponse raises, orjson writes null),
+    floats below 1e-4 whose exponent is spelled differently, non-str keys
+    and any other type (datetimes, enums, UUIDs, subclasses).
+    """
+    stack = [content]
+    pop, push, extend = stack.pop, stack.append, stack.extend
+    while stack:
+        value = pop()
+        cls = value.__class__
+        if cls in _ORJSON_EXACT_TYPES:
+            continue
+        if cls is float:
+            if not isfinite(value) or value and -1e-4 < value < 1e-4:
+                return False
+        elif cls is list or cls is tuple:
+            extend(value)
+        elif cls is dict:
+            for key, item in value.items():
+                if key.__class__ is not str:
+                    return False
+                push(item)
+        else:
+            return False
+    return True
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when it is installed.
+
+    One type-check pass decides whether orjson would produce the same bytes;
+    anything else goes through JSONResponse.render, so the body (or the error
+    for NaN and unsupported types) is always the same as JSONResponse's.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None and _orjson_matches_json(content):
+            try:
+                return orjson.dumps(content)
+            except orjson.JSONEncodeError:
+                pass  # e.g. integers beyond 64 bits
+        return super().render(content)
+
+
+__all__ = ['FastJSONResponse']
@@ -36,6 +36,7 @@ from dsl.core.parser import (
 from dsl.atoms.implementations import *  # Register atoms
 from dsl.atoms.deploy import *  # Register deploy atoms
 from dsl.atoms.data import *  # Register data definition atoms
+from dsl.api.responses import FastJSONResponse
 
 # Create FastAPI app
 app = FastAPI(
@@ -43,7 +44,8 @@ app = FastAPI(
     description="REST API for executing analytics pipelines",
     version="2.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=FastJSONResponse,
 )
 
 # CORS
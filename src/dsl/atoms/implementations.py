@@ -5,12 +5,12 @@ Concrete implementations of atomic operations for pipelines
 """
 
 from typing import Any, Dict, List, Optional, Union
+import sys
 import json
 import csv
 import io
 from pathlib import Path
 
-import httpx
 from datetime import datetime, date
 from decimal import Decimal
 
@@ -110,6 +110,8 @@ def _load_http(url: str, params: Dict) -> Any:
     timeout = float(params.get('timeout', 10))
     headers = params.get('headers') if isinstance(params.get('headers'), dict) else None
 
+    import httpx  # Deferred: only needed for remote sources
+
     with httpx.Client(follow_redirects=True, timeout=timeout) as client:
         resp = client.get(url, headers=headers)
         resp.raise_for_status()
@@ -339,18 +341,18 @@ def transform_rename(ctx: PipelineContext, **mapping) -> Any:
 @AtomRegistry.register("metrics", "calculate")
 def metrics_calculate(ctx: PipelineContext, metrics: List[str] = None, field: str = None, **params) -> Dict:
     """Calculate multiple metrics"""
-    data = ctx.get_data()
     metrics = metrics or params.get('_arg0', ['sum', 'avg', 'count'])
     
     ctx.log(f"Calculating metrics: {metrics}")
     
     result = {}
-    values = _extract_values(data, field)
+    values = _extract_values(ctx.get_data(), field)
+    total = sum(values) if values and ('sum' in metrics or 'avg' in metrics) else 0
     
     if 'sum' in metrics:
-        result['sum'] = sum(values) if values else 0
+        result['sum'] = total
     if 'avg' in metrics:
-        result['avg'] = sum(values) / len(values) if values else 0
+        result['avg'] = total / len(values) if values else 0
     if 'count' in metrics:
         result['count'] = len(values)
     if 'min' in metrics:
@@ -374,8 +376,7 @@ def _extract_values(data: Any, field: str = None) -> List[float]:
 def metrics_sum(ctx: PipelineContext, field: str = None, **params) -> float:
     """Calculate sum"""
     field = field or params.get('_arg0')
-    data = ctx.get_data()
-    values = _extract_values(data, field)
+    values = _extract_values(ctx.get_data(), field)
     return sum(values)
 
 
@@ -383,8 +384,7 @@ def metrics_sum(ctx: PipelineContext, field: str = None, **params) -> float:
 def metrics_avg(ctx: PipelineContext, field: str = None, **params) -> float:
     """Calculate average"""
     field = field or params.get('_arg0')
-    data = ctx.get_data()
-    values = _extract_values(data, field)
+    values = _extract_values(ctx.get_data(), field)
     return sum(values) / len(values) if values else 0
 
 
@@ -408,8 +408,7 @@ def metrics_variance(ctx: PipelineContext, field: str, **params) -> Dict:
 @AtomRegistry.register("metrics", "percentile")
 def metrics_percentile(ctx: PipelineContext, field: str, p: int = 50, **params) -> float:
     """Calculate percentile"""
-    data = ctx.get_data()
-    values = sorted(_extract_values(data, field))
+    values = sorted(_extract_values(ctx.get_data(), field))
     
     if not values:
         return 0
@@ -865,6 +864,30 @@ def _generate_view_id(prefix: str) -> str:
     return f"{prefix}_{_view_counter}"
 
 
+# Rows inspected when inferring table columns from data
+_COLUMN_SAMPLE_ROWS = 32
+
+# Enum-like view option values. Parsed DSL strings are fresh objects; mapping
+# them onto these interned constants lets every spec share one copy and turns
+# equality checks downstream into identity hits.
+_VIEW_CHOICES = {
+    value: sys.intern(value)
+    for value in (
+        "bar", "line", "pie", "area", "scatter", "donut", "gauge",
+        "currency", "percent", "number", "text", "markdown", "html",
+        "default", "success", "info", "warning", "danger",
+        "grid", "flex", "tabs",
+    )
+}
+
+
+def _choice(value: Any) -> Any:
+    """Return the interned constant for a known view option value"""
+    if value.__class__ is str:
+        return _VIEW_CHOICES.get(value, value)
+    return value
+
+
 def _wrap_view_result(data: Any, view_spec: Dict) -> Dict:
     """Wrap data and view spec into result format"""
     if isinstance(data, dict) and "views" in data:
@@ -873,12 +896,9 @@ def _wrap_view_result(data: Any, view_spec: Dict) -> Dict:
     return {"data": data, "views": [view_spec]}
 
 
-@AtomRegistry.register("view", "chart")
-def view_chart(ctx: PipelineContext, **params) -> Dict:
-    """Generate chart view specification"""
-    data = ctx.get_data()
-    
-    chart_type = params.get("type", params.get("_arg0", "bar"))
+def _chart_spec(params: Dict, data: Any) -> Dict:
+    """Build chart view spec from DSL params"""
+    chart_type = _choice(params.get("type", params.get("_arg0", "bar")))
     x_field = params.get("x", params.get("x_field", ""))
     y_field = params.get("y", params.get("y_field", ""))
     series = params.get("series", [])
@@ -888,8 +908,6 @@ def view_chart(ctx: PipelineContext, **params) -> Dict:
     show_grid = params.get("grid", True)
     data_path = params.get("data_path", params.get("dataPath", ""))
     
-    ctx.log(f"Creating chart view: {chart_type}")
-    
     spec = {
         "type": "chart",
         "id": _generate_view_id("chart"),
@@ -901,17 +919,23 @@ def view_chart(ctx: PipelineContext, **params) -> Dict:
         "colors": colors if isinstance(colors, list) else [colors],
         "show_legend": show_legend,
         "show_grid": show_grid,
-        **({"data_path": data_path} if data_path else {}),
     }
-    
-    return _wrap_view_result(data, spec)
+    if data_path:
+        spec["data_path"] = data_path
+    return spec
 
 
-@AtomRegistry.register("view", "table")
-def view_table(ctx: PipelineContext, **params) -> Dict:
-    """Generate table view specification"""
+@AtomRegistry.register("view", "chart")
+def view_chart(ctx: PipelineContext, **params) -> Dict:
+    """Generate chart view specification"""
     data = ctx.get_data()
-    
+    spec = _chart_spec(params, data)
+    ctx.log(f"Creating chart view: {spec['chart_type']}")
+    return _wrap_view_result(data, spec)
+
+
+def _table_spec(params: Dict, data: Any) -> Dict:
+    """Build table view spec from DSL params, inferring columns from data"""
     columns_input = params.get("columns", params.get("_arg0", []))
     title = params.get("title", "")
     sortable = params.get("sortable", True)
@@ -933,10 +957,10 @@ def view_table(ctx: PipelineContext, **params) -> Dict:
     # Auto-detect columns from data if not specified
     if not columns and isinstance(data, list) and len(data) > 0:
         if isinstance(data[0], dict):
-            columns = [{"field": k, "header": k.replace("_", " ").title()} 
-                      for k in data[0].keys()]
-    
-    ctx.log(f"Creating table view with {len(columns)} columns")
+            fields = dict.fromkeys(
+                k for row in data[:_COLUMN_SAMPLE_ROWS] if isinstance(row, dict) for k in row
+            )
+            columns = [{"field": k, "header": k.replace("_", " ").title()} for k in fields]
     
     spec = {
         "type": "table",
@@ -948,102 +972,153 @@ def view_table(ctx: PipelineContext, **params) -> Dict:
         "paginate": paginate,
         "page_size": page_size,
         "striped": striped,
-        **({"data_path": data_path} if data_path else {}),
     }
-    
+    if data_path:
+        spec["data_path"] = data_path
+    return spec
+
+
+@AtomRegistry.register("view", "table")
+def view_table(ctx: PipelineContext, **params) -> Dict:
+    """Generate table view specification"""
+    data = ctx.get_data()
+    spec = _table_spec(params, data)
+    ctx.log(f"Creating table view with {len(spec['columns'])} columns")
     return _wrap_view_result(data, spec)
 
 
+def _card_spec(params: Dict, data: Any) -> Dict:
+    """Build metric card spec from DSL params"""
+    return {
+        "type": "card",
+        "id": _generate_view_id("card"),
+        "title": params.get("title", ""),
+        "value_field": params.get("value", params.get("_arg0", "")),
+        "format": _choice(params.get("format", "")),
+        "icon": params.get("icon", ""),
+        "style": _choice(params.get("style", "default")),
+        "trend_field": params.get("trend", ""),
+    }
+
+
 @AtomRegistry.register("view", "card")
 def view_card(ctx: PipelineContext, **params) -> Dict:
     """Generate metric card specification"""
     data = ctx.get_data()
-    
-    value_field = params.get("value", params.get("_arg0", ""))
-    title = params.get("title", "")
-    format_str = params.get("format", "")
-    icon = params.get("icon", "")
-    style = params.get("style", "default")
-    trend_field = params.get("trend", "")
-    
-    ctx.log(f"Creating card view: {title}")
-    
-    spec = {
-        "type": "card",
-        "id": _generate_view_id("card"),
-        "title": title,
-        "value_field": value_field,
-        "format": format_str,
-        "icon": icon,
-        "style": style,
-        "trend_field": trend_field,
-    }
-    
+    spec = _card_spec(params, data)
+    ctx.log(f"Creating card view: {spec['title']}")
     return _wrap_view_result(data, spec)
 
 
+def _kpi_spec(params: Dict, data: Any) -> Dict:
+    """Build KPI widget spec from DSL params"""
+    return {
+        "type": "kpi",
+        "id": _generate_view_id("kpi"),
+        "title": params.get("title", ""),
+        "value_field": params.get("value", params.get("_arg0", "")),
+        "target_field": params.get("target", ""),
+        "format": _choice(params.get("format", "")),
+        "icon": params.get("icon", ""),
+        "show_progress": params.get("progress", True),
+    }
+
+
 @AtomRegistry.register("view", "kpi")
 def view_kpi(ctx: PipelineContext, **params) -> Dict:
     """Generate KPI widget specification"""
     data = ctx.get_data()
-    
-    value_field = params.get("value", params.get("_arg0", ""))
-    target_field = params.get("target", "")
-    title = params.get("title", "")
-    format_str = params.get("format", "")
-    icon = params.get("icon", "")
-    show_progress = params.get("progress", True)
-    
-    ctx.log(f"Creating KPI view: {title}")
-    
-    spec = {
-        "type": "kpi",
-        "id": _generate_view_id("kpi"),
-        "title": title,
-        "value_field": value_field,
-        "target_field": target_field,
-        "format": format_str,
-        "icon": icon,
-        "show_progress": show_progress,
-    }
-    
+    spec = _kpi_spec(params, data)
+    ctx.log(f"Creating KPI view: {spec['title']}")
     return _wrap_view_result(data, spec)
 
 
+def _grid_spec(params: Dict, data: Any) -> Dict:
+    """Build grid layout spec from DSL params"""
+    return {
+        "type": "grid",
+        "id": _generate_view_id("grid"),
+        "title": params.get("title", ""),
+        "columns": params.get("columns", params.get("_arg0", 2)),
+        "gap": params.get("gap", 16),
+        "items": params.get("items", []),
+    }
+
+
 @AtomRegistry.register("view", "grid")
 def view_grid(ctx: PipelineContext, **params) -> Dict:
     """Generate grid layout specification"""
     data = ctx.get_data()
-    
-    columns = params.get("columns", params.get("_arg0", 2))
-    gap = params.get("gap", 16)
-    items = params.get("items", [])
-    title = params.get("title", "")
-    
-    ctx.log(f"Creating grid view: {columns} columns")
-    
+    spec = _grid_spec(params, data)
+    ctx.log(f"Creating grid view: {spec['columns']} columns")
+    return _wrap_view_result(data, spec)
+
+
+def _text_spec(params: Dict, data: Any) -> Dict:
+    """Build text/markdown view spec from DSL params"""
+    return {
+        "type": "text",
+        "id": _generate_view_id("text"),
+        "title": params.get("title", ""),
+        "content": params.get("content", params.get("_arg0", "")),
+        "format": _choice(params.get("format", "text")),
+    }
+
+
+def _list_spec(params: Dict, data: Any) -> Dict:
+    """Build list view spec from DSL params"""
     spec = {
-        "type": "grid",
-        "id": _generate_view_id("grid"),
-        "title": title,
-        "columns": columns,
-        "gap": gap,
-        "items": items,
+        "type": "list",
+        "id": _generate_view_id("list"),
+        "title": params.get("title", ""),
+        "primary_field": params.get("primary", params.get("_arg0", "")),
+        "secondary_field": params.get("secondary", ""),
+        "icon_field": params.get("icon", ""),
     }
-    
-    return _wrap_view_result(data, spec)
+    data_path = params.get("data_path")
+    if data_path:
+        spec["data_path"] = data_path
+    return spec
+
+
+# Spec builders for views that can be declared as dashboard children
+_CHILD_VIEW_SPECS = {
+    "chart": _chart_spec,
+    "table": _table_spec,
+    "card": _card_spec,
+    "kpi": _kpi_spec,
+    "grid": _grid_spec,
+    "text": _text_spec,
+    "list": _list_spec,
+}
+
+
+def _child_view_spec(child: Dict, data: Any) -> Dict:
+    """Build one dashboard child, e.g. {"view": "card", "value": "total"}"""
+    if not isinstance(child, dict) or child.get("view") not in _CHILD_VIEW_SPECS:
+        raise ValueError(f"Dashboard child must name one of {list(_CHILD_VIEW_SPECS)} in 'view': {child!r}")
+    params = {k: v for k, v in child.items() if k != "view"}
+    return _CHILD_VIEW_SPECS[child["view"]](params, data)
 
 
 @AtomRegistry.register("view", "dashboard")
 def view_dashboard(ctx: PipelineContext, **params) -> Dict:
-    """Generate dashboard specification"""
+    """Generate dashboard specification
+    
+    Child views listed in ``children`` are built in the same call and appended
+    to ``widgets`` as full view specs.
+    """
     data = ctx.get_data()
     
-    layout = params.get("layout", params.get("_arg0", "grid"))
+    layout = _choice(params.get("layout", params.get("_arg0", "grid")))
     widgets = params.get("widgets", [])
+    children = params.get("children")
     title = params.get("title", "")
     refresh = params.get("refresh", 0)
     
+    if children:
+        widgets = list(widgets) + [_child_view_spec(child, data) for child in children]
+    
     ctx.log(f"Creating dashboard view: {title}")
     
     spec = {
@@ -1062,21 +1137,8 @@ def view_dashboard(ctx: PipelineContext, **params) -> Dict:
 def view_text(ctx: PipelineContext, **params) -> Dict:
     """Generate text/markdown view specification"""
     data = ctx.get_data()
-    
-    content = params.get("content", params.get("_arg0", ""))
-    format_type = params.get("format", "text")
-    title = params.get("title", "")
-    
+    spec = _text_spec(params, data)
     ctx.log(f"Creating text view")
-    
-    spec = {
-        "type": "text",
-        "id": _generate_view_id("text"),
-        "title": title,
-        "content": content,
-        "format": format_type,
-    }
-    
     return _wrap_view_result(data, spec)
 
 
@@ -1084,24 +1146,8 @@ def view_text(ctx: PipelineContext, **params) -> Dict:
 def view_list(ctx: PipelineContext, **params) -> Dict:
     """Generate list view specification"""
     data = ctx.get_data()
-    
-    title = params.get("title", "")
-    primary_field = params.get("primary", params.get("_arg0", ""))
-    secondary_field = params.get("secondary", "")
-    icon_field = params.get("icon", "")
-    
+    spec = _list_spec(params, data)
     ctx.log(f"Creating list view")
-    
-    spec = {
-        "type": "list",
-        "id": _generate_view_id("list"),
-        "title": title,
-        "primary_field": primary_field,
-        "secondary_field": secondary_field,
-        "icon_field": icon_field,
-        **({"data_path": params.get("data_path")} if params.get("data_path") else {}),
-    }
-    
     return _wrap_view_result(data, spec)
 
 
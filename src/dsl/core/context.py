@@ -11,13 +11,17 @@ Provides:
 """
 
 from typing import Any, Dict, List, Optional
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
 from datetime import datetime
 
 import re
 
 
-@dataclass
+# $VAR or ${VAR} inside a larger string
+_VAR_PATTERN = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}|\$([A-Za-z_][A-Za-z0-9_]*)")
+
+
+@dataclass(slots=True)
 class PipelineContext:
     """
     Context passed through pipeline execution.
@@ -39,14 +43,24 @@ class PipelineContext:
     data: Any = None
     metadata: Dict[str, Any] = field(default_factory=dict)
     errors: List[Dict[str, Any]] = field(default_factory=list)
-    logs: List[Dict[str, Any]] = field(default_factory=list)
+    logs: InitVar[Optional[List[Dict[str, Any]]]] = None
+    
+    # Log entries as dicts, plus newer entries stored column-wise until `logs`
+    # is read; see _flush_logs()
+    _logs: List[Dict[str, Any]] = field(default_factory=list, init=False, repr=False)
+    _log_levels: List[str] = field(default_factory=list, init=False, repr=False)
+    _log_messages: List[str] = field(default_factory=list, init=False, repr=False)
+    _log_times: List[datetime] = field(default_factory=list, init=False, repr=False)
+    _log_steps: List[int] = field(default_factory=list, init=False, repr=False)
     
     # Execution tracking
     started_at: Optional[datetime] = None
     step_count: int = 0
     
-    def __post_init__(self):
+    def __post_init__(self, logs: Optional[List[Dict[str, Any]]]):
         self.started_at = datetime.utcnow()
+        if logs is not None:
+            self._logs = logs
     
     def resolve_variable(self, value: Any) -> Any:
         """
@@ -61,7 +75,7 @@ class PipelineContext:
         Raises:
             ValueError: If variable is undefined
         """
-        if not isinstance(value, str):
+        if not isinstance(value, str) or '$' not in value:
             return value
 
         # Exact variable reference: $VAR or ${VAR}
@@ -78,8 +92,6 @@ class PipelineContext:
             raise ValueError(f"Undefined variable: {value}")
 
         # Interpolation inside string
-        pattern = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}|\$([A-Za-z_][A-Za-z0-9_]*)")
-
         def repl(m: re.Match) -> str:
             token = m.group(0)
             var_name = m.group(1) or m.group(2)
@@ -87,10 +99,7 @@ class PipelineContext:
                 return str(self.variables[var_name])
             raise ValueError(f"Undefined variable: {token}")
 
-        if '$' in value and pattern.search(value):
-            return pattern.sub(repl, value)
-
-        return value
+        return _VAR_PATTERN.sub(repl, value)
     
     def resolve_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -102,17 +111,17 @@ class PipelineContext:
         Returns:
             Dict with all variables resolved
         """
-        def resolve_any(v: Any) -> Any:
-            if isinstance(v, dict):
-                return self.resolve_params(v)
-            if isinstance(v, list):
-                return [resolve_any(item) for item in v]
-            return self.resolve_variable(v)
-
-        resolved: Dict[str, Any] = {}
-        for k, v in params.items():
-            resolved[k] = resolve_any(v)
-        return resolved
+        return {k: self._resolve_any(v) for k, v in params.items()}
+    
+    def _resolve_any(self, value: Any) -> Any:
+        """Resolve variables in a param value, recursing into dicts and lists."""
+        if isinstance(value, str):
+            return self.resolve_variable(value) if '$' in value else value
+        if isinstance(value, dict):
+            return self.resolve_params(value)
+        if isinstance(value, list):
+            return [self._resolve_any(item) for item in value]
+        return value
     
     def log(self, message: str, level: str = "info"):
         """
@@ -122,12 +131,37 @@ class PipelineContext:
             message: Log message
             level: Log level (debug, info, warn, error)
         """
-        self.logs.append({
-            "level": level,
-            "message": message,
-            "timestamp": datetime.utcnow().isoformat(),
-            "step": self.step_count
-        })
+        self._log_levels.append(level)
+        self._log_messages.append(message)
+        self._log_times.append(datetime.utcnow())
+        self._log_steps.append(self.step_count)
+    
+    def _flush_logs(self) -> List[Dict[str, Any]]:
+        """Move column-stored entries into the log list and return that list."""
+        if self._log_messages:
+            self._logs.extend(
+                {
+                    "level": level,
+                    "message": message,
+                    "timestamp": timestamp.isoformat(),
+                    "step": step
+                }
+                for level, message, timestamp, step in zip(
+                    self._log_levels, self._log_messages, self._log_times, self._log_steps
+                )
+            )
+            self._clear_pending_logs()
+        return self._logs
+    
+    def _clear_pending_logs(self):
+        self._log_levels.clear()
+        self._log_messages.clear()
+        self._log_times.clear()
+        self._log_steps.clear()
+    
+    def _set_logs(self, entries: List[Dict[str, Any]]):
+        self._clear_pending_logs()
+        self._logs = entries
     
     def error(self, message: str, exception: Exception = None, step: str = None):
         """
@@ -226,7 +260,7 @@ class PipelineContext:
             "execution_time_ms": self.execution_time_ms(),
             "has_errors": self.has_errors(),
             "error_count": len(self.errors),
-            "log_count": len(self.logs)
+            "log_count": len(self._logs) + len(self._log_messages)
         }
     
     def clone(self) -> "PipelineContext":
@@ -241,5 +275,14 @@ class PipelineContext:
         )
 
 
+# Assigned after the class is built: `logs` is also the InitVar behind the
+# PipelineContext(logs=...) constructor argument
+PipelineContext.logs = property(
+    PipelineContext._flush_logs,
+    PipelineContext._set_logs,
+    doc="Log entries as dicts; the list can be appended to, cleared or replaced.",
+)
+
+
 # Alias for backwards compatibility
 DSLPipelineContext = PipelineContext
@@ -101,13 +101,15 @@ class PipelineExecutor:
         Returns:
             PipelineContext with results
         """
-        from .parser import PipelineDefinition
+        from .parser import PipelineDefinition, parse
         
         ctx = context or self.context
         
         # Parse if string
         if isinstance(pipeline, str):
-            pipeline = self.parser.parse(pipeline)
+            # parse() hands out a per-call copy of the cached definition, so
+            # hooks and handlers can't mutate what later runs will see
+            pipeline = parse(pipeline)
         
         # Merge variables
         ctx.variables.update(pipeline.variables)
@@ -187,12 +189,14 @@ class PipelineExecutor:
         Returns:
             PipelineContext with results
         """
-        from .parser import PipelineDefinition
+        from .parser import PipelineDefinition, parse
         
         ctx = context or self.context
         
         if isinstance(pipeline, str):
-            pipeline = self.parser.parse(pipeline)
+            # parse() hands out a per-call copy of the cached definition, so
+            # hooks and handlers can't mutate what later runs will see
+            pipeline = parse(pipeline)
         
         ctx.variables.update(pipeline.variables)
         
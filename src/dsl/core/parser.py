@@ -44,6 +44,8 @@ Example Usage:
 
 from __future__ import annotations
 import re
+import sys
+import copy
 import json
 import yaml
 from typing import Any, Dict, List, Optional, Callable, Union
@@ -51,7 +53,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from abc import ABC, abstractmethod
 import asyncio
-from functools import reduce
+import threading
+from functools import reduce, lru_cache
 
 # Import from refactored modules
 from .registry import AtomRegistry
@@ -83,13 +86,22 @@ class AtomType(Enum):
     STREAM = "stream"
 
 
-@dataclass
+# Direct name -> member map; avoids Enum.__call__ and try/except on unknown modules
+_NAME_TO_TYPE: Dict[str, AtomType] = {t.value: t for t in AtomType}
+
+
+@dataclass(slots=True)
 class Atom:
     """Single atomic operation in pipeline"""
     type: AtomType
     action: str
     params: Dict[str, Any] = field(default_factory=dict)
     
+    def __post_init__(self):
+        # Actions repeat across pipelines; share one string per action name
+        if isinstance(self.action, str):
+            self.action = sys.intern(self.action)
+    
     def to_dict(self) -> Dict:
         return {
             "type": self.type.value,
@@ -98,22 +110,35 @@ class Atom:
         }
     
     def to_dsl(self) -> str:
-        params_str = ", ".join(
-            f'{k}={repr(v)}' if isinstance(v, str) else f'{k}={v}'
-            for k, v in self.params.items()
-        )
-        return f"{self.type.value}.{self.action}({params_str})"
+        parts: List[str] = []
+        self._write_dsl(parts)
+        return "".join(parts)
+    
+    def _write_dsl(self, parts: List[str]) -> None:
+        """Append this atom's DSL fragments to a shared buffer"""
+        parts += (self.type.value, ".", self.action, "(")
+        sep = ""
+        for k, v in self.params.items():
+            parts += (sep, k, "=", repr(v) if isinstance(v, str) else str(v))
+            sep = ", "
+        parts.append(")")
     
     @classmethod
     def from_dict(cls, data: Dict) -> "Atom":
-        return cls(
-            type=AtomType(data["type"]),
-            action=data["action"],
-            params=data.get("params", {})
-        )
+        atom_type = _NAME_TO_TYPE.get(data["type"])
+        if atom_type is None:
+            atom_type = AtomType(data["type"])
+        action = data["action"]
+        
+        # Fill the slots directly instead of going through __init__/__post_init__
+        atom = object.__new__(cls)
+        atom.type = atom_type
+        atom.action = sys.intern(action) if isinstance(action, str) else action
+        atom.params = data.get("params", {})
+        return atom
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineStep:
     """A step in the pipeline with metadata"""
     atom: Atom
@@ -123,6 +148,10 @@ class PipelineStep:
     cache_key: Optional[str] = None
 
 
+# Keys exposed by PipelineDefinition.to_dict() and its dict-style access
+_DEFINITION_KEYS = frozenset(("name", "version", "description", "domain", "variables", "steps"))
+
+
 @dataclass
 class PipelineDefinition:
     """Complete pipeline definition"""
@@ -135,11 +164,28 @@ class PipelineDefinition:
     
     def __getitem__(self, key: str) -> Any:
         """Allow dict-like access for backwards compatibility"""
-        return self.to_dict()[key]
+        # Only "steps" needs serializing; other keys map straight to attributes
+        if key == "steps":
+            return self._steps_to_dicts()
+        if key in _DEFINITION_KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
     
     def __contains__(self, key: str) -> bool:
         """Support 'in' operator"""
-        return key in self.to_dict()
+        return key in _DEFINITION_KEYS
+    
+    def _steps_to_dicts(self) -> List[Dict]:
+        return [
+            {
+                "atom": step.atom.to_dict(),
+                "condition": step.condition,
+                "on_error": step.on_error,
+                "timeout": step.timeout,
+                "cache_key": step.cache_key
+            }
+            for step in self.steps
+        ]
     
     def to_dict(self) -> Dict:
         return {
@@ -148,16 +194,7 @@ class PipelineDefinition:
             "description": self.description,
             "domain": self.domain,
             "variables": self.variables,
-            "steps": [
-                {
-                    "atom": step.atom.to_dict(),
-                    "condition": step.condition,
-                    "on_error": step.on_error,
-                    "timeout": step.timeout,
-                    "cache_key": step.cache_key
-                }
-                for step in self.steps
-            ]
+            "steps": self._steps_to_dicts()
         }
     
     def to_yaml(self) -> str:
@@ -170,11 +207,26 @@ class PipelineDefinition:
         for var, val in self.variables.items():
             lines.append(f"  ${var} = {repr(val)}")
         
-        dsl_steps = " | ".join(step.atom.to_dsl() for step in self.steps)
-        lines.append(f"  {dsl_steps}")
+        # All steps are written into one buffer and joined once
+        step_parts = ["  "]
+        sep = ""
+        for step in self.steps:
+            step_parts.append(sep)
+            step.atom._write_dsl(step_parts)
+            sep = " | "
+        lines.append("".join(step_parts))
         return "\n".join(lines)
 
 
+@lru_cache(maxsize=None)
+def _compile_token_regex(patterns: tuple) -> "re.Pattern":
+    """Compile the combined token regex once per distinct pattern set"""
+    return re.compile('|'.join(
+        f'(?P<{name}>{pattern})'
+        for name, pattern in patterns
+    ))
+
+
 class DSLTokenizer:
     """Tokenize DSL string into components"""
     
@@ -202,11 +254,9 @@ class DSLTokenizer:
     }
     
     def __init__(self):
-        self.pattern = '|'.join(
-            f'(?P<{name}>{pattern})' 
-            for name, pattern in self.PATTERNS.items()
-        )
-        self.regex = re.compile(self.pattern)
+        # Compiled regex is shared by all tokenizers with the same PATTERNS
+        self.regex = _compile_token_regex(tuple(self.PATTERNS.items()))
+        self.pattern = self.regex.pattern
     
     def tokenize(self, code: str) -> List[tuple]:
         tokens = []
@@ -230,17 +280,24 @@ class DSLTokenizer:
         return tokens
 
 
+_EOF_TOKEN = ('EOF', None)
+
+
 class DSLParser:
     """Parse tokenized DSL into pipeline definition"""
     
     def __init__(self):
         self.tokenizer = DSLTokenizer()
-        self.tokens = []
+        self.tokens = [_EOF_TOKEN]
         self.pos = 0
+        self._end = 0
     
     def parse(self, code: str) -> PipelineDefinition:
         """Parse DSL code into pipeline definition"""
+        # Trailing EOF sentinel lets lookahead index tokens without bounds checks
         self.tokens = self.tokenizer.tokenize(code)
+        self._end = len(self.tokens)
+        self.tokens.append(_EOF_TOKEN)
         self.pos = 0
         
         name = "anonymous"
@@ -303,10 +360,7 @@ class DSLParser:
         if self._check('LPAREN'):
             params = self._parse_params()
         
-        try:
-            atom_type = AtomType(module)
-        except ValueError:
-            atom_type = AtomType.DATA  # Default
+        atom_type = _NAME_TO_TYPE.get(module, AtomType.DATA)  # Default DATA
         
         return PipelineStep(
             atom=Atom(type=atom_type, action=action, params=params)
@@ -413,16 +467,15 @@ class DSLParser:
         return items
     
     def _current(self) -> tuple:
-        if self._is_at_end():
-            return ('EOF', None)
         return self.tokens[self.pos]
     
     def _check(self, token_type: str) -> bool:
-        return not self._is_at_end() and self._current()[0] == token_type
+        return self.tokens[self.pos][0] == token_type
     
     def _advance(self) -> tuple:
-        token = self._current()
-        self.pos += 1
+        token = self.tokens[self.pos]
+        if self.pos < self._end:
+            self.pos += 1
         return token
     
     def _expect(self, token_type: str) -> tuple:
@@ -431,7 +484,38 @@ class DSLParser:
         return self._advance()
     
     def _is_at_end(self) -> bool:
-        return self.pos >= len(self.tokens)
+        return self.pos >= self._end
+
+
+@dataclass(slots=True)
+class _StepPlan:
+    """A pipeline step with its lookup key, log text and param handling precomputed"""
+    atom_type: str
+    action: str
+    params: Dict[str, Any]
+    resolve: bool
+    dsl: str
+    on_error: str
+
+
+def _needs_resolve(value: Any) -> bool:
+    """Whether a param value must go through PipelineContext.resolve_params"""
+    if value.__class__ is str:
+        return '$' in value
+    return value.__class__ not in _SHARED_VALUE_TYPES
+
+
+def _plan_step(step: PipelineStep) -> _StepPlan:
+    """Precompute everything about a step that does not depend on the context"""
+    atom = step.atom
+    return _StepPlan(
+        atom_type=atom.type.value,
+        action=atom.action,
+        params=atom.params,
+        resolve=any(_needs_resolve(v) for v in atom.params.values()),
+        dsl=atom.to_dsl(),
+        on_error=step.on_error,
+    )
 
 
 class PipelineExecutor:
@@ -439,44 +523,63 @@ class PipelineExecutor:
     
     def __init__(self, context: PipelineContext = None):
         self.context = context or PipelineContext()
-        self.parser = DSLParser()
+        self._parser = None
     
-    def execute(self, pipeline: Union[str, PipelineDefinition]) -> PipelineContext:
-        """Execute a pipeline"""
-        if isinstance(pipeline, str):
-            pipeline = self.parser.parse(pipeline)
+    @property
+    def parser(self) -> DSLParser:
+        """Parser for callers that parse through the executor; created on first use"""
+        if self._parser is None:
+            self._parser = DSLParser()
+        return self._parser
+    
+    def compile(self, pipeline: Union[str, PipelineDefinition]) -> Callable[[PipelineContext], PipelineContext]:
+        """
+        Prepare a pipeline for repeated execution.
         
-        # Merge variables
-        self.context.variables.update(pipeline.variables)
+        Step plans are built once; the returned function runs them against
+        any context. Handlers are still looked up per run, so atoms registered
+        later are picked up.
+        """
+        variables, plan = _compile(pipeline)
         
-        # Execute each step
-        for step in pipeline.steps:
-            self._execute_step(step)
+        def run(context: PipelineContext) -> PipelineContext:
+            # Variables come from the shared cache; give each run its own copy
+            context.variables.update(_copy_values(variables))
+            for step in plan:
+                self._run_step(step, context)
+            return context
         
-        return self.context
+        return run
+    
+    def execute(self, pipeline: Union[str, PipelineDefinition]) -> PipelineContext:
+        """Execute a pipeline"""
+        return self.compile(pipeline)(self.context)
     
     def _execute_step(self, step: PipelineStep):
         """Execute a single step"""
-        atom = step.atom
-        handler = AtomRegistry.get(atom.type.value, atom.action)
+        self._run_step(_plan_step(step), self.context)
+    
+    def _run_step(self, step: _StepPlan, ctx: PipelineContext):
+        """Execute a single planned step"""
+        handler = AtomRegistry.get(step.atom_type, step.action)
         
         if not handler:
-            raise ValueError(f"Unknown atom: {atom.type.value}.{atom.action}")
+            raise ValueError(f"Unknown atom: {step.atom_type}.{step.action}")
         
         # Resolve parameters
-        params = self.context.resolve_params(atom.params)
+        params = ctx.resolve_params(step.params) if step.resolve else step.params
         
         # Log execution
-        self.context.log(f"Executing: {atom.to_dsl()}")
+        ctx.log(f"Executing: {step.dsl}")
         
         try:
             # Execute handler
-            result = handler(self.context, **params)
+            result = handler(ctx, **params)
             if result is not None:
-                self.context.set_data(result)
+                ctx.set_data(result)
         except Exception as e:
-            self.context.errors.append({
-                "step": atom.to_dsl(),
+            ctx.errors.append({
+                "step": step.dsl,
                 "error": str(e)
             })
             if step.on_error == "stop":
@@ -484,26 +587,27 @@ class PipelineExecutor:
     
     async def execute_async(self, pipeline: Union[str, PipelineDefinition]) -> PipelineContext:
         """Async execution for I/O bound operations"""
-        if isinstance(pipeline, str):
-            pipeline = self.parser.parse(pipeline)
-        
-        self.context.variables.update(pipeline.variables)
+        variables, plan = _compile(pipeline)
+        self.context.variables.update(_copy_values(variables))
         
-        for step in pipeline.steps:
-            await self._execute_step_async(step)
+        for step in plan:
+            await self._run_step_async(step)
         
         return self.context
     
     async def _execute_step_async(self, step: PipelineStep):
         """Execute step asynchronously"""
-        atom = step.atom
-        handler = AtomRegistry.get(atom.type.value, atom.action)
+        await self._run_step_async(_plan_step(step))
+    
+    async def _run_step_async(self, step: _StepPlan):
+        """Execute a planned step asynchronously"""
+        handler = AtomRegistry.get(step.atom_type, step.action)
         
         if not handler:
-            raise ValueError(f"Unknown atom: {atom.type.value}.{atom.action}")
+            raise ValueError(f"Unknown atom: {step.atom_type}.{step.action}")
         
-        params = self.context.resolve_params(atom.params)
-        self.context.log(f"Executing async: {atom.to_dsl()}")
+        params = self.context.resolve_params(step.params) if step.resolve else step.params
+        self.context.log(f"Executing async: {step.dsl}")
         
         try:
             if asyncio.iscoroutinefunction(handler):
@@ -515,13 +619,24 @@ class PipelineExecutor:
                 self.context.set_data(result)
         except Exception as e:
             self.context.errors.append({
-                "step": atom.to_dsl(),
+                "step": step.dsl,
                 "error": str(e)
             })
             if step.on_error == "stop":
                 raise
 
 
+_parser_local = threading.local()
+
+
+def _get_parser() -> DSLParser:
+    """Return the DSLParser reused by parse() in the current thread"""
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        parser = _parser_local.parser = DSLParser()
+    return parser
+
+
 # ============================================================
 # FLUENT PIPELINE BUILDER
 # ============================================================
@@ -819,8 +934,7 @@ def Pipeline(dsl_or_domain: str = None, domain: str = None) -> Union[PipelineBui
         # Otherwise treat it as a domain name
         is_dsl = '(' in dsl_or_domain or '|' in dsl_or_domain or '@pipeline' in dsl_or_domain
         if is_dsl:
-            parser = DSLParser()
-            return parser.parse(dsl_or_domain)
+            return _get_parser().parse(dsl_or_domain)
         else:
             # Treat as domain name
             return PipelineBuilder(domain=dsl_or_domain)
@@ -837,9 +951,96 @@ def execute(pipeline: Union[str, PipelineDefinition, PipelineBuilder],
     return executor.execute(pipeline)
 
 
+# Single step with at most one string/integer argument, e.g. data.load("sales.csv")
+_SIMPLE_STEP = re.compile(r'\s*([a-z_]+)\.([a-z_]+)\((?:"([^"]*)"|(\d+))?\)\s*')
+
+
+def _parse_simple(match: "re.Match") -> PipelineDefinition:
+    """Build the definition for a single-step input without tokenizing it"""
+    module, action, string_arg, int_arg = match.groups()
+    params = {}
+    if string_arg is not None:
+        params['_arg0'] = string_arg
+    elif int_arg is not None:
+        params['_arg0'] = int(int_arg)
+    
+    atom_type = _NAME_TO_TYPE.get(module, AtomType.DATA)
+    
+    return PipelineDefinition(
+        name="anonymous",
+        steps=[PipelineStep(atom=Atom(type=atom_type, action=action, params=params))]
+    )
+
+
+# Shared, read-only definitions keyed by stripped source. Only leading and
+# trailing whitespace is dropped: collapsing inner runs would alter string
+# literals. Never hand these out directly: parse() copies them and the
+# executor copies variables before merging them into a context.
+@lru_cache(maxsize=1024)
+def _parse_cached(dsl_code: str) -> PipelineDefinition:
+    return _get_parser().parse(dsl_code)
+
+
+# Parsed values of these types are immutable and can be shared between copies
+_SHARED_VALUE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _copy_values(values: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a params/variables dict, deep-copying only mutable values"""
+    return {
+        k: v if v.__class__ in _SHARED_VALUE_TYPES else copy.deepcopy(v)
+        for k, v in values.items()
+    }
+
+
+# Step plans for cached definitions, keyed like _parse_cached
+@lru_cache(maxsize=1024)
+def _compile_cached(dsl_code: str) -> tuple:
+    pipeline = _parse_cached(dsl_code)
+    return pipeline.variables, tuple(map(_plan_step, pipeline.steps))
+
+
+def _compile(pipeline: Union[str, PipelineDefinition]) -> tuple:
+    """Return (variables, step plans) for DSL text or a definition"""
+    if isinstance(pipeline, str):
+        return _compile_cached(pipeline.strip())
+    return pipeline.variables, tuple(map(_plan_step, pipeline.steps))
+
+
+def _copy_definition(pipeline: PipelineDefinition) -> PipelineDefinition:
+    """Copy a parsed definition so callers can mutate it freely"""
+    return PipelineDefinition(
+        name=pipeline.name,
+        steps=[
+            PipelineStep(
+                atom=Atom(
+                    type=step.atom.type,
+                    action=step.atom.action,
+                    params=_copy_values(step.atom.params)
+                ),
+                condition=step.condition,
+                on_error=step.on_error,
+                timeout=step.timeout,
+                cache_key=step.cache_key
+            )
+            for step in pipeline.steps
+        ],
+        variables=_copy_values(pipeline.variables),
+        description=pipeline.description,
+        version=pipeline.version,
+        domain=pipeline.domain
+    )
+
+
 def parse(dsl_code: str) -> PipelineDefinition:
-    """Parse DSL code to pipeline definition"""
-    return DSLParser().parse(dsl_code)
+    """Parse DSL code to pipeline definition.
+    
+    Results are cached by source string; each call returns a fresh copy.
+    """
+    match = _SIMPLE_STEP.fullmatch(dsl_code)
+    if match:
+        return _parse_simple(match)
+    return _copy_definition(_parse_cached(dsl_code.strip()))
 
 
 # Alias for backwards compatibility
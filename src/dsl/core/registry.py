@@ -9,7 +9,7 @@ Provides:
 - Parameter validation system
 """
 
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 from functools import wraps
@@ -29,6 +29,15 @@ class ParamType(Enum):
     ANY = "any"
 
 
+_PARAM_TYPE_MAP = {
+    ParamType.STRING: str,
+    ParamType.NUMBER: (int, float),
+    ParamType.BOOLEAN: bool,
+    ParamType.ARRAY: (list, tuple),
+    ParamType.OBJECT: dict,
+}
+
+
 @dataclass
 class Required:
     """Mark a parameter as required"""
@@ -42,14 +51,7 @@ class Required:
             return True
         if isinstance(self.type, type):
             return isinstance(value, self.type)
-        type_map = {
-            ParamType.STRING: str,
-            ParamType.NUMBER: (int, float),
-            ParamType.BOOLEAN: bool,
-            ParamType.ARRAY: (list, tuple),
-            ParamType.OBJECT: dict,
-        }
-        return isinstance(value, type_map.get(self.type, object))
+        return isinstance(value, _PARAM_TYPE_MAP.get(self.type, object))
 
 
 @dataclass
@@ -66,14 +68,7 @@ class Optional_:
             return True
         if isinstance(self.type, type):
             return isinstance(value, self.type)
-        type_map = {
-            ParamType.STRING: str,
-            ParamType.NUMBER: (int, float),
-            ParamType.BOOLEAN: bool,
-            ParamType.ARRAY: (list, tuple),
-            ParamType.OBJECT: dict,
-        }
-        return isinstance(value, type_map.get(self.type, object))
+        return isinstance(value, _PARAM_TYPE_MAP.get(self.type, object))
 
 
 @dataclass
@@ -121,6 +116,8 @@ class AtomRegistry:
     
     _atoms: Dict[str, Dict[str, AtomInfo]] = {}
     _handlers: Dict[str, Dict[str, Callable]] = {}
+    # Flat (type, action) index used by get() on the execution hot path
+    _flat: Dict[Tuple[str, str], Callable] = {}
     
     @classmethod
     def register(cls, atom_type: str, action: str, **metadata):
@@ -154,13 +151,14 @@ class AtomRegistry:
             
             cls._atoms[atom_type][action] = info
             cls._handlers[atom_type][action] = func
+            cls._flat[(atom_type, action)] = func
             return func
         return decorator
     
     @classmethod
     def get(cls, atom_type: str, action: str) -> Optional[Callable]:
         """Get atom handler by type and action"""
-        return cls._handlers.get(atom_type, {}).get(action)
+        return cls._flat.get((atom_type, action))
     
     @classmethod
     def get_info(cls, atom_type: str, action: str) -> Optional[AtomInfo]:
@@ -205,6 +203,7 @@ class AtomRegistry:
         """Clear all registered atoms (for testing)"""
         cls._atoms.clear()
         cls._handlers.clear()
+        cls._flat.clear()
 
 
 def _param_to_dict(param) -> Dict:
@@ -254,43 +253,52 @@ def atom_params(**param_specs):
         # Store param specs on function
         func._atom_params = param_specs
         
+        # Signature tables are fixed per atom; build them once, not per call
+        required_params = tuple(k for k, v in param_specs.items() if isinstance(v, Required))
+        optional_defaults = tuple(
+            (k, v.default) for k, v in param_specs.items() if isinstance(v, Optional_)
+        )
+        checks = tuple(
+            (name, spec) for name, spec in param_specs.items()
+            if isinstance(spec, (Required, OneOf))
+        )
+        
         @wraps(func)
         def wrapper(ctx, **kwargs):
             # Map _arg0, _arg1, etc. to named params
-            positional_params = sorted(
-                [k for k in kwargs if k.startswith('_arg')],
-                key=lambda x: int(x[4:])
-            )
-            required_params = [k for k, v in param_specs.items() if isinstance(v, Required)]
-            
-            # Map positional args to required params
-            for i, arg_key in enumerate(positional_params):
-                if i < len(required_params):
-                    param_name = required_params[i]
-                    if param_name not in kwargs or kwargs.get(param_name) is None:
-                        kwargs[param_name] = kwargs.pop(arg_key)
-                    else:
-                        kwargs.pop(arg_key, None)
+            positional_params = [k for k in kwargs if k.startswith('_arg')]
+            if positional_params:
+                positional_params.sort(key=lambda x: int(x[4:]))
+                
+                # Map positional args to required params
+                for i, arg_key in enumerate(positional_params):
+                    if i < len(required_params):
+                        param_name = required_params[i]
+                        if param_name not in kwargs or kwargs.get(param_name) is None:
+                            kwargs[param_name] = kwargs.pop(arg_key)
+                        else:
+                            kwargs.pop(arg_key, None)
             
             # Apply defaults for optional params
-            for name, spec in param_specs.items():
-                if isinstance(spec, Optional_) and name not in kwargs:
-                    kwargs[name] = spec.default
+            for name, default in optional_defaults:
+                if name not in kwargs:
+                    kwargs[name] = default
             
             # Validate required params
             errors = []
-            for name, spec in param_specs.items():
-                value = kwargs.get(name)
-                if isinstance(spec, Required) and not spec.validate(value):
-                    errors.append(f"Required parameter '{name}' is missing or invalid")
-                elif isinstance(spec, OneOf) and not spec.validate(value):
-                    errors.append(f"Parameter '{name}' must be one of {spec.values}")
+            for name, spec in checks:
+                if not spec.validate(kwargs.get(name)):
+                    if isinstance(spec, Required):
+                        errors.append(f"Required parameter '{name}' is missing or invalid")
+                    else:
+                        errors.append(f"Parameter '{name}' must be one of {spec.values}")
             
             if errors:
                 raise ValueError("; ".join(errors))
             
             # Remove any remaining _argN keys
-            kwargs = {k: v for k, v in kwargs.items() if not k.startswith('_arg')}
+            if positional_params:
+                kwargs = {k: v for k, v in kwargs.items() if not k.startswith('_arg')}
             
             return func(ctx, **kwargs)
         
@@ -12,8 +12,20 @@ Available modules:
 - voice: Voice input processing
 """
 
-from typing import Dict, List, Any, Protocol, runtime_checkable
+from typing import Dict, List, Any, Protocol, Union, runtime_checkable
 from abc import ABC, abstractmethod
+from decimal import Decimal
+
+
+# Amounts accepted by calculators: Decimal for exact reporting, float for fast analytics
+Number = Union[Decimal, float, int]
+
+
+def to_decimal(value: Number) -> Decimal:
+    """Promote a number to Decimal (floats go through str to avoid binary noise)"""
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(str(value))
 
 
 @runtime_checkable
@@ -79,4 +91,6 @@ __all__ = [
     "register_module",
     "get_module",
     "list_modules",
+    "Number",
+    "to_decimal",
 ]
@@ -11,10 +11,12 @@ Features:
 - Alert history and analytics
 """
 
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Iterable, Union
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+import math
+import operator
 
 from .. import BaseModule
 
@@ -45,6 +47,16 @@ class ComparisonOperator(Enum):
     NEQ = "neq"     # not equal
 
 
+_COMPARATORS: Dict[ComparisonOperator, Callable[[Any, Any], bool]] = {
+    ComparisonOperator.GT: operator.gt,
+    ComparisonOperator.GTE: operator.ge,
+    ComparisonOperator.LT: operator.lt,
+    ComparisonOperator.LTE: operator.le,
+    ComparisonOperator.EQ: operator.eq,
+    ComparisonOperator.NEQ: operator.ne,
+}
+
+
 class NotificationChannel(Enum):
     """Notification delivery channels"""
     EMAIL = "email"
@@ -69,19 +81,8 @@ class AlertRule:
     
     def evaluate(self, value: float) -> bool:
         """Evaluate if value triggers this rule"""
-        if self.operator == ComparisonOperator.GT:
-            return value > self.threshold
-        elif self.operator == ComparisonOperator.GTE:
-            return value >= self.threshold
-        elif self.operator == ComparisonOperator.LT:
-            return value < self.threshold
-        elif self.operator == ComparisonOperator.LTE:
-            return value <= self.threshold
-        elif self.operator == ComparisonOperator.EQ:
-            return value == self.threshold
-        elif self.operator == ComparisonOperator.NEQ:
-            return value != self.threshold
-        return False
+        compare = _COMPARATORS.get(self.operator)
+        return compare(value, self.threshold) if compare else False
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -136,6 +137,39 @@ class Alert:
         }
 
 
+class RollingStats:
+    """Running mean/variance (Welford's algorithm) for streaming anomaly checks.
+    
+    Each update is O(1) and the observed values are not kept.
+    """
+    
+    __slots__ = ("n", "mean", "m2")
+    
+    def __init__(self, values: Iterable[float] = ()):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        for value in values:
+            self.update(value)
+    
+    def update(self, value: float) -> None:
+        """Add one observation"""
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (value - self.mean)
+    
+    @property
+    def variance(self) -> float:
+        """Sample variance (n - 1), as statistics.variance"""
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+    
+    @property
+    def std(self) -> float:
+        """Sample standard deviation, as statistics.stdev"""
+        return math.sqrt(self.variance)
+
+
 class AlertEngine:
     """Alert processing engine"""
     
@@ -170,17 +204,26 @@ class AlertEngine:
     
     @staticmethod
     def detect_anomaly(
-        values: List[float],
+        values: Union[List[float], RollingStats],
         current: float,
         std_multiplier: float = 2.0
     ) -> Dict[str, Any]:
-        """Detect anomaly using standard deviation"""
-        if len(values) < 2:
-            return {"is_anomaly": False, "reason": "Insufficient data"}
+        """Detect anomaly using standard deviation.
         
-        import statistics
-        mean = statistics.mean(values)
-        std = statistics.stdev(values)
+        values is either the history itself or a RollingStats kept up to date by the caller.
+        """
+        if isinstance(values, RollingStats):
+            if values.n < 2:
+                return {"is_anomaly": False, "reason": "Insufficient data"}
+            mean = values.mean
+            std = values.std
+        else:
+            if len(values) < 2:
+                return {"is_anomaly": False, "reason": "Insufficient data"}
+            import numpy as np
+            history = np.asarray(values, dtype=np.float64)
+            mean = float(history.mean())
+            std = float(history.std(ddof=1))
         
         lower_bound = mean - (std_multiplier * std)
         upper_bound = mean + (std_multiplier * std)
@@ -311,5 +354,6 @@ __all__ = [
     "ComparisonOperator",
     "NotificationChannel",
     "AlertEngine",
+    "RollingStats",
     "alerts_module",
 ]
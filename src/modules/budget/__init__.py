@@ -11,13 +11,15 @@ Features:
 - Multi-scenario budgeting
 """
 
-from typing import Dict, List, Any, Optional
+import re
+from typing import Dict, List, Any, Optional, Pattern, Tuple
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
+from functools import lru_cache
 
-from .. import BaseModule
+from .. import BaseModule, Number, to_decimal
 
 
 class BudgetCategory(Enum):
@@ -119,14 +121,38 @@ class Budget:
         }
 
 
+DEFAULT_EXPENSE_RULES: Dict[str, List[str]] = {
+    "personnel": ["salary", "wages", "bonus", "benefits"],
+    "marketing": ["ads", "advertising", "promotion", "campaign"],
+    "it": ["software", "hardware", "cloud", "hosting"],
+    "travel": ["flight", "hotel", "transport", "travel"],
+}
+
+
+@lru_cache(maxsize=64)
+def _compile_expense_rules(
+    rules: Tuple[Tuple[str, Tuple[str, ...]], ...]
+) -> List[Tuple[str, Optional[Pattern]]]:
+    """Compile each category's keywords into one alternation regex"""
+    return [
+        (category, re.compile("|".join(map(re.escape, keywords))) if keywords else None)
+        for category, keywords in rules
+    ]
+
+
 class BudgetCalculator:
     """Budget calculation utilities"""
     
     @staticmethod
-    def calculate_variance(planned: Decimal, actual: Decimal) -> Dict[str, Any]:
-        """Calculate variance metrics"""
+    def calculate_variance(planned: Number, actual: Number, precise: bool = True) -> Dict[str, Any]:
+        """Calculate variance metrics (precise=False computes in float)"""
+        if precise:
+            planned, actual = to_decimal(planned), to_decimal(actual)
+        else:
+            planned, actual = float(planned), float(actual)
+        
         variance = actual - planned
-        variance_pct = (variance / planned * 100) if planned != 0 else Decimal("0")
+        variance_pct = (variance / planned * 100) if planned != 0 else 0
         
         return {
             "planned": float(planned),
@@ -141,42 +167,39 @@ class BudgetCalculator:
         expenses: List[Dict[str, Any]], 
         rules: Optional[Dict[str, List[str]]] = None
     ) -> Dict[str, List[Dict[str, Any]]]:
-        """Categorize expenses based on rules"""
-        rules = rules or {
-            "personnel": ["salary", "wages", "bonus", "benefits"],
-            "marketing": ["ads", "advertising", "promotion", "campaign"],
-            "it": ["software", "hardware", "cloud", "hosting"],
-            "travel": ["flight", "hotel", "transport", "travel"],
-        }
+        """Categorize expenses based on rules (first matching category wins)"""
+        rules = rules or DEFAULT_EXPENSE_RULES
+        matchers = _compile_expense_rules(
+            tuple((category, tuple(keywords)) for category, keywords in rules.items())
+        )
         
         categorized: Dict[str, List[Dict[str, Any]]] = {cat: [] for cat in rules}
         categorized["other"] = []
         
         for expense in expenses:
             desc = expense.get("description", "").lower()
-            matched = False
             
-            for category, keywords in rules.items():
-                if any(kw in desc for kw in keywords):
+            for category, pattern in matchers:
+                if pattern is not None and pattern.search(desc):
                     categorized[category].append(expense)
-                    matched = True
                     break
-            
-            if not matched:
+            else:
                 categorized["other"].append(expense)
         
         return categorized
     
     @staticmethod
     def project_spending(
-        current_spent: Decimal,
+        current_spent: Number,
         days_elapsed: int,
-        total_days: int
+        total_days: int,
+        precise: bool = True
     ) -> Dict[str, Any]:
         """Project end-of-period spending based on current rate"""
         if days_elapsed <= 0:
             return {"projected": 0, "daily_rate": 0}
         
+        current_spent = to_decimal(current_spent) if precise else float(current_spent)
         daily_rate = current_spent / days_elapsed
         projected = daily_rate * total_days
         
@@ -267,5 +290,6 @@ __all__ = [
     "BudgetCategory",
     "BudgetScenario",
     "BudgetCalculator",
+    "DEFAULT_EXPENSE_RULES",
     "budget_module",
 ]
@@ -83,11 +83,10 @@ class ForecastCalculator:
         if len(data) < window:
             return data
         
-        result = []
-        for i in range(len(data) - window + 1):
-            avg = sum(data[i:i + window]) / window
-            result.append(round(avg, 2))
-        return result
+        import numpy as np
+        values = np.asarray(data, dtype=np.float64)
+        averages = np.convolve(values, np.ones(window), mode="valid") / window
+        return [round(avg, 2) for avg in averages.tolist()]
     
     @staticmethod
     def exponential_smoothing(data: List[float], alpha: float = 0.3) -> List[float]:
@@ -95,10 +94,14 @@ class ForecastCalculator:
         if not data:
             return []
         
-        result = [data[0]]
-        for i in range(1, len(data)):
-            smoothed = alpha * data[i] + (1 - alpha) * result[-1]
-            result.append(round(smoothed, 2))
+        # Each step feeds on the previous rounded value, so this stays sequential
+        beta = 1 - alpha
+        smoothed = data[0]
+        result = [smoothed]
+        append = result.append
+        for value in data[1:]:
+            smoothed = round(alpha * value + beta * smoothed, 2)
+            append(smoothed)
         return result
     
     @staticmethod
@@ -108,11 +111,14 @@ class ForecastCalculator:
         if n < 2:
             return {"slope": 0, "intercept": data[0] if data else 0}
         
+        import numpy as np
+        values = np.asarray(data, dtype=np.float64)
         x_mean = (n - 1) / 2
-        y_mean = sum(data) / n
+        y_mean = float(values.mean())
+        x_centered = np.arange(n) - x_mean
         
-        numerator = sum((i - x_mean) * (y - y_mean) for i, y in enumerate(data))
-        denominator = sum((i - x_mean) ** 2 for i in range(n))
+        numerator = float(x_centered @ (values - y_mean))
+        denominator = float(x_centered @ x_centered)
         
         slope = numerator / denominator if denominator != 0 else 0
         intercept = y_mean - slope * x_mean
@@ -198,14 +204,19 @@ class ForecastCalculator:
         if len(actual) != len(predicted) or not actual:
             return {}
         
-        errors = [a - p for a, p in zip(actual, predicted)]
-        abs_errors = [abs(e) for e in errors]
-        pct_errors = [abs(e / a) * 100 if a != 0 else 0 for e, a in zip(errors, actual)]
+        import numpy as np
+        actual_arr = np.asarray(actual, dtype=np.float64)
+        errors = actual_arr - np.asarray(predicted, dtype=np.float64)
+        abs_errors = np.abs(errors)
+        pct_errors = np.divide(
+            abs_errors * 100, np.abs(actual_arr),
+            out=np.zeros_like(errors), where=actual_arr != 0
+        )
         
         return {
-            "mae": round(sum(abs_errors) / len(abs_errors), 2),  # Mean Absolute Error
-            "mape": round(sum(pct_errors) / len(pct_errors), 2),  # Mean Absolute Percentage Error
-            "rmse": round((sum(e ** 2 for e in errors) / len(errors)) ** 0.5, 2),  # Root Mean Square Error
+            "mae": round(float(abs_errors.mean()), 2),  # Mean Absolute Error
+            "mape": round(float(pct_errors.mean()), 2),  # Mean Absolute Percentage Error
+            "rmse": round(float(np.sqrt((errors ** 2).mean())), 2),  # Root Mean Square Error
         }
 
 
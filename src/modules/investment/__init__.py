@@ -12,14 +12,14 @@ Features:
 - Risk assessment
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
 import math
 
-from .. import BaseModule
+from .. import BaseModule, Number, to_decimal
 
 
 class InvestmentType(Enum):
@@ -77,18 +77,41 @@ class Investment:
         }
 
 
+def _npv_with_derivative(flows: List[float], rate: float) -> Tuple[float, float]:
+    """NPV of flows (period 0 first) and its derivative with respect to rate.
+    
+    Single pass with a running discount factor instead of two pow-based sums.
+    """
+    step = 1 / (1 + rate)
+    discount = 1.0
+    npv = 0.0
+    derivative = 0.0
+    for i, cf in enumerate(flows):
+        pv = cf * discount
+        npv += pv
+        derivative -= i * pv * step
+        discount *= step
+    return npv, derivative
+
+
 class InvestmentCalculator:
     """Investment calculation utilities"""
     
     @staticmethod
     def calculate_roi(
-        initial_investment: Decimal,
-        total_returns: Decimal
+        initial_investment: Number,
+        total_returns: Number,
+        precise: bool = True
     ) -> Dict[str, Any]:
-        """Calculate Return on Investment"""
+        """Calculate Return on Investment (precise=False computes in float)"""
         if initial_investment == 0:
             return {"roi": 0, "roi_percent": 0}
         
+        if precise:
+            initial_investment, total_returns = to_decimal(initial_investment), to_decimal(total_returns)
+        else:
+            initial_investment, total_returns = float(initial_investment), float(total_returns)
+        
         net_profit = total_returns - initial_investment
         roi = (net_profit / initial_investment) * 100
         
@@ -108,14 +131,18 @@ class InvestmentCalculator:
         """Calculate Net Present Value"""
         npv = -float(initial_investment)
         rate = float(discount_rate)
+        growth = 1 + rate
+        factor = 1.0
         
         discounted_flows = []
         for i, cf in enumerate(cash_flows, 1):
-            pv = float(cf) / ((1 + rate) ** i)
+            factor *= growth
+            cash_flow = float(cf)
+            pv = cash_flow / factor
             npv += pv
             discounted_flows.append({
                 "period": i,
-                "cash_flow": float(cf),
+                "cash_flow": cash_flow,
                 "present_value": round(pv, 2),
             })
         
@@ -137,20 +164,13 @@ class InvestmentCalculator:
         """Calculate Internal Rate of Return using Newton-Raphson method"""
         flows = [-float(initial_investment)] + [float(cf) for cf in cash_flows]
         
-        def npv_at_rate(rate: float) -> float:
-            return sum(cf / ((1 + rate) ** i) for i, cf in enumerate(flows))
-        
-        def npv_derivative(rate: float) -> float:
-            return sum(-i * cf / ((1 + rate) ** (i + 1)) for i, cf in enumerate(flows))
-        
         rate = 0.1  # Initial guess
         
         for _ in range(max_iterations):
-            npv = npv_at_rate(rate)
+            npv, derivative = _npv_with_derivative(flows, rate)
             if abs(npv) < tolerance:
                 return round(rate * 100, 2)
             
-            derivative = npv_derivative(rate)
             if derivative == 0:
                 return None
             
@@ -163,11 +183,20 @@ class InvestmentCalculator:
     
     @staticmethod
     def calculate_payback_period(
-        initial_investment: Decimal,
-        cash_flows: List[Decimal]
+        initial_investment: Number,
+        cash_flows: List[Number],
+        precise: bool = True
     ) -> Dict[str, Any]:
-        """Calculate payback period"""
-        cumulative = Decimal("0")
+        """Calculate payback period (precise=False computes in float)"""
+        if precise:
+            initial_investment = to_decimal(initial_investment)
+            cash_flows = [to_decimal(cf) for cf in cash_flows]
+            cumulative = Decimal("0")
+        else:
+            initial_investment = float(initial_investment)
+            cash_flows = [float(cf) for cf in cash_flows]
+            cumulative = 0.0
+        
         payback_period = None
         cumulative_by_period = []
         
@@ -10,15 +10,91 @@ Features:
 - Email/webhook distribution
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, TextIO
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
 from enum import Enum
+from math import isfinite
+import csv
+import io
 import json
+import re
+
+try:
+    import orjson
+except ImportError:  # orjson is in requirements.txt; stdlib json is the fallback
+    orjson = None
 
 from .. import BaseModule
 
 
+if orjson is not None:
+    # Datetimes go through default=str, as with json.dumps
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+# Leaf types orjson writes exactly like json.dumps(indent=2, default=str);
+# floats are checked separately
+_ORJSON_EXACT_TYPES = frozenset({str, int, bool, type(None), datetime, date, time, Decimal})
+
+# json.dumps escapes everything outside printable ASCII that orjson leaves as is
+_JSON_NON_ASCII = re.compile(r"[^\x00-\x7e]")
+
+
+def _orjson_matches_json(obj: Any) -> bool:
+    """Whether orjson output for obj is byte-identical to json.dumps.
+    
+    Rejects enums, numpy and other types json.dumps renders via str(),
+    non-finite floats (NaN vs null), floats below 1e-4 whose exponent is
+    spelled differently, and keys other than str/int.
+    """
+    stack = [obj]
+    pop, push, extend = stack.pop, stack.append, stack.extend
+    while stack:
+        value = pop()
+        cls = value.__class__
+        if cls in _ORJSON_EXACT_TYPES:
+            continue
+        if cls is float:
+            if not isfinite(value) or value and -1e-4 < value < 1e-4:
+                return False
+        elif cls is list or cls is tuple:
+            extend(value)
+        elif cls is dict:
+            for key, item in value.items():
+                if key.__class__ is not str and key.__class__ is not int:
+                    return False
+                push(item)
+        else:
+            return False
+    return True
+
+
+def _escape_non_ascii(match: "re.Match") -> str:
+    code = ord(match.group())
+    if code < 0x10000:
+        return "\\u%04x" % code
+    code -= 0x10000
+    return "\\u%04x\\u%04x" % (0xD800 | (code >> 10), 0xDC00 | (code & 0x3FF))
+
+
+def _dumps(obj: Any) -> str:
+    """
+    Serialize report payload as indented JSON (unknown types via str).
+    
+    Output is identical to json.dumps(obj, indent=2, default=str); orjson is
+    used for payloads it renders the same way, json.dumps for the rest.
+    """
+    if orjson is not None and _orjson_matches_json(obj):
+        try:
+            text = orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS).decode()
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; let stdlib json handle them
+        else:
+            return _JSON_NON_ASCII.sub(_escape_non_ascii, text)
+    return json.dumps(obj, indent=2, default=str)
+
+
 class ReportFormat(Enum):
     """Report output formats"""
     PDF = "pdf"
@@ -97,6 +173,27 @@ class ScheduledReport:
         }
 
 
+# Static parts of the HTML report; the title is inserted between them
+_HTML_DOCTYPE_OPEN = """<!DOCTYPE html>
+<html>
+<head>
+    <title>"""
+
+_HTML_HEAD_CLOSE = """</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 40px; }
+        h1 { color: #333; }
+        h2 { color: #666; border-bottom: 1px solid #ddd; }
+        table { border-collapse: collapse; width: 100%; margin: 20px 0; }
+        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+        th { background-color: #f4f4f4; }
+        .metric { font-size: 24px; font-weight: bold; color: #2196F3; }
+    </style>
+</head>
+<body>
+    <h1>"""
+
+
 class ReportGenerator:
     """Report generation utilities"""
     
@@ -104,68 +201,52 @@ class ReportGenerator:
     def generate_html(title: str, data: Dict[str, Any], sections: List[str] = None) -> str:
         """Generate HTML report"""
         sections = sections or list(data.keys())
+        title = str(title)  # joined directly below, so convert like the f-strings do
         
-        html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>{title}</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 40px; }}
-        h1 {{ color: #333; }}
-        h2 {{ color: #666; border-bottom: 1px solid #ddd; }}
-        table {{ border-collapse: collapse; width: 100%; margin: 20px 0; }}
-        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-        th {{ background-color: #f4f4f4; }}
-        .metric {{ font-size: 24px; font-weight: bold; color: #2196F3; }}
-    </style>
-</head>
-<body>
-    <h1>{title}</h1>
-    <p>Generated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}</p>
-"""
+        parts = [
+            _HTML_DOCTYPE_OPEN, title, _HTML_HEAD_CLOSE, title,
+            "</h1>\n    <p>Generated: ", datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC'), "</p>\n",
+        ]
+        append = parts.append
         
         for section in sections:
             if section in data:
-                html += f"    <h2>{section.replace('_', ' ').title()}</h2>\n"
+                append(f"    <h2>{section.replace('_', ' ').title()}</h2>\n")
                 section_data = data[section]
                 
                 if isinstance(section_data, dict):
-                    html += "    <table>\n"
+                    append("    <table>\n")
                     for key, value in section_data.items():
-                        html += f"        <tr><th>{key}</th><td>{value}</td></tr>\n"
-                    html += "    </table>\n"
+                        append(f"        <tr><th>{key}</th><td>{value}</td></tr>\n")
+                    append("    </table>\n")
                 elif isinstance(section_data, list):
                     if section_data and isinstance(section_data[0], dict):
-                        html += "    <table>\n"
-                        html += "        <tr>"
-                        for key in section_data[0].keys():
-                            html += f"<th>{key}</th>"
-                        html += "</tr>\n"
+                        append("    <table>\n        <tr>")
+                        parts.extend(f"<th>{key}</th>" for key in section_data[0].keys())
+                        append("</tr>\n")
                         for item in section_data:
-                            html += "        <tr>"
-                            for value in item.values():
-                                html += f"<td>{value}</td>"
-                            html += "</tr>\n"
-                        html += "    </table>\n"
+                            append("        <tr>")
+                            parts.extend(f"<td>{value}</td>" for value in item.values())
+                            append("</tr>\n")
+                        append("    </table>\n")
                     else:
-                        html += f"    <ul>\n"
-                        for item in section_data:
-                            html += f"        <li>{item}</li>\n"
-                        html += "    </ul>\n"
+                        append("    <ul>\n")
+                        parts.extend(f"        <li>{item}</li>\n" for item in section_data)
+                        append("    </ul>\n")
                 else:
-                    html += f"    <p class='metric'>{section_data}</p>\n"
+                    append(f"    <p class='metric'>{section_data}</p>\n")
         
-        html += "</body>\n</html>"
-        return html
+        append("</body>\n</html>")
+        return "".join(parts)
     
     @staticmethod
     def generate_json(title: str, data: Dict[str, Any]) -> str:
         """Generate JSON report"""
-        return json.dumps({
+        return _dumps({
             "title": title,
             "generated_at": datetime.utcnow().isoformat(),
             "data": data,
-        }, indent=2, default=str)
+        })
     
     @staticmethod
     def generate_csv(data: List[Dict[str, Any]]) -> str:
@@ -173,14 +254,25 @@ class ReportGenerator:
         if not data:
             return ""
         
-        headers = list(data[0].keys())
-        lines = [",".join(headers)]
-        
-        for row in data:
-            values = [str(row.get(h, "")) for h in headers]
-            lines.append(",".join(values))
+        buffer = io.StringIO()
+        ReportGenerator.generate_csv_stream(data, buffer)
+        return buffer.getvalue()[:-1]  # Drop the final line terminator
+    
+    @staticmethod
+    def generate_csv_stream(data: List[Dict[str, Any]], fp: TextIO) -> None:
+        """Write CSV rows straight to a file-like object (columns from the first row)"""
+        if not data:
+            return
         
-        return "\n".join(lines)
+        writer = csv.DictWriter(
+            fp,
+            fieldnames=list(data[0].keys()),
+            restval="",
+            extrasaction="ignore",
+            lineterminator="\n",
+        )
+        writer.writeheader()
+        writer.writerows(data)
 
 
 class ReportsModule(BaseModule):
@@ -246,7 +338,7 @@ class ReportsModule(BaseModule):
         elif report_format == ReportFormat.CSV and isinstance(data, list):
             content = ReportGenerator.generate_csv(data)
         else:
-            content = json.dumps(data, indent=2, default=str)
+            content = _dumps(data)
         
         report = Report(
             id=report_id,
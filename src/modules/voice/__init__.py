@@ -10,10 +10,11 @@ Features:
 - Audio file processing
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, FrozenSet, List, Any, Optional, Pattern, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 import re
 
 from .. import BaseModule
@@ -36,7 +37,7 @@ class AudioFormat(Enum):
     M4A = "m4a"
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionResult:
     """Result of speech-to-text transcription"""
     id: str
@@ -59,7 +60,7 @@ class TranscriptionResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class VoiceCommand:
     """Parsed voice command"""
     raw_text: str
@@ -78,6 +79,72 @@ class VoiceCommand:
         }
 
 
+# DSL skeletons per intent, filled with a single % operation
+_DSL_LOAD = 'data.load("%s")'
+_DSL_METRIC = 'metrics.%s("%s")'
+_DSL_FILTER = 'transform.filter(%s)'
+_DSL_REPORT = 'report.generate("%s")'
+_DSL_FORECAST = 'forecast.predict(%d)'
+_DSL_ALERT = 'alert.threshold("%s", "%s", %s)'
+
+_LEADING_GROUP = re.compile(r"\(([^()]*)\)")
+_TRIGGER_WORD = re.compile(r"\w+")
+
+
+def _compile_intent_patterns(intent_patterns: Dict[str, List[str]]) -> Tuple[Tuple[str, Pattern], ...]:
+    """Compile intent patterns once, flattened in priority order"""
+    return tuple(
+        (intent, re.compile(pattern, re.IGNORECASE))
+        for intent, patterns in intent_patterns.items()
+        for pattern in patterns
+    )
+
+
+def _compile_entity_patterns(entity_patterns: Dict[str, str]) -> Tuple[Tuple[str, Pattern], ...]:
+    """Compile entity extraction patterns once"""
+    return tuple(
+        (name, re.compile(pattern, re.IGNORECASE))
+        for name, pattern in entity_patterns.items()
+    )
+
+
+def _build_trigger_index(
+    intent_patterns: Dict[str, List[str]]
+) -> Tuple[Pattern, Dict[str, FrozenSet[str]], FrozenSet[str]]:
+    """Index the leading trigger words of every intent pattern.
+    
+    Returns one regex matching any trigger (overlapping, longest first), a map from
+    matched trigger to the intents it may start, and the intents whose patterns do
+    not start with a required group of plain words and must always be tried.
+    Triggers are lower-cased, since they are matched against lower-cased text.
+    """
+    by_trigger: Dict[str, set] = {}
+    always = set()
+    for intent, patterns in intent_patterns.items():
+        for pattern in patterns:
+            match = _LEADING_GROUP.match(pattern)
+            words = match.group(1).split("|") if match else ()
+            if (
+                not match
+                or pattern[match.end():match.end() + 1] in ("?", "*", "{")
+                or not all(_TRIGGER_WORD.fullmatch(word) for word in words)
+            ):
+                always.add(intent)
+                continue
+            for word in words:
+                by_trigger.setdefault(word.lower(), set()).add(intent)
+    
+    words = sorted(by_trigger, key=len, reverse=True)
+    regex = re.compile("(?=(" + "|".join(map(re.escape, words)) + "))") if words else re.compile(r"(?!)()")
+    
+    # A longer trigger hides any shorter trigger that is its prefix at the same position
+    index = {
+        word: frozenset().union(*(by_trigger[other] for other in words if word.startswith(other)))
+        for word in words
+    }
+    return regex, index, frozenset(always)
+
+
 class VoiceCommandParser:
     """Parse voice commands into DSL"""
     
@@ -117,25 +184,66 @@ class VoiceCommandParser:
         "file": r"plik\s+['\"]?([^'\"]+)['\"]?",
     }
     
+    # Spoken words mapped to DSL values
+    FUNCTION_MAP = {"sumę": "sum", "średnią": "avg", "ilość": "count",
+                    "sum": "sum", "average": "avg", "count": "count"}
+    UNIT_DAYS = {"dni": 1, "tygodni": 7, "miesięcy": 30,
+                 "days": 1, "weeks": 7, "months": 30}
+    
+    # Patterns above compiled once per class; subclasses recompile their own
+    _INTENT_REGEXES = _compile_intent_patterns(INTENT_PATTERNS)
+    _ENTITY_REGEXES = _compile_entity_patterns(ENTITY_PATTERNS)
+    _TRIGGER_REGEX, _TRIGGER_INTENTS, _UNTRIGGERED_INTENTS = _build_trigger_index(INTENT_PATTERNS)
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._INTENT_REGEXES = _compile_intent_patterns(cls.INTENT_PATTERNS)
+        cls._ENTITY_REGEXES = _compile_entity_patterns(cls.ENTITY_PATTERNS)
+        cls._TRIGGER_REGEX, cls._TRIGGER_INTENTS, cls._UNTRIGGERED_INTENTS = (
+            _build_trigger_index(cls.INTENT_PATTERNS)
+        )
+    
     @classmethod
     def parse(cls, text: str) -> VoiceCommand:
-        """Parse voice text into command"""
+        """Parse voice text into command.
+        
+        Results are cached per exact utterance; each call returns its own copy,
+        so callers may modify the command freely.
+        """
+        command = _parse_cached(cls, text)
+        return VoiceCommand(
+            raw_text=command.raw_text,
+            intent=command.intent,
+            entities=_copy_entities(command.entities),
+            dsl=command.dsl,
+            confidence=command.confidence,
+        )
+    
+    @classmethod
+    def _parse_uncached(cls, text: str) -> VoiceCommand:
+        """Match intents and build the command for one utterance"""
         text_lower = text.lower().strip()
         
-        for intent, patterns in cls.INTENT_PATTERNS.items():
-            for pattern in patterns:
-                match = re.search(pattern, text_lower, re.IGNORECASE)
-                if match:
-                    entities = cls._extract_entities(text, match.groups())
-                    dsl = cls._generate_dsl(intent, entities)
-                    
-                    return VoiceCommand(
-                        raw_text=text,
-                        intent=intent,
-                        entities=entities,
-                        dsl=dsl,
-                        confidence=0.85,
-                    )
+        # One scan for trigger words narrows which intent patterns can match at all
+        candidates = set(cls._UNTRIGGERED_INTENTS)
+        for trigger in cls._TRIGGER_REGEX.finditer(text_lower):
+            candidates |= cls._TRIGGER_INTENTS[trigger.group(1)]
+        
+        for intent, regex in cls._INTENT_REGEXES:
+            if intent not in candidates:
+                continue
+            match = regex.search(text_lower)
+            if match:
+                entities = cls._extract_entities(text, match.groups())
+                dsl = cls._generate_dsl(intent, entities)
+                
+                return VoiceCommand(
+                    raw_text=text,
+                    intent=intent,
+                    entities=entities,
+                    dsl=dsl,
+                    confidence=0.85,
+                )
         
         # No intent matched
         return VoiceCommand(
@@ -151,8 +259,8 @@ class VoiceCommandParser:
         """Extract entities from matched groups"""
         entities = {"matched_groups": list(groups)}
         
-        for name, pattern in cls.ENTITY_PATTERNS.items():
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for name, regex in cls._ENTITY_REGEXES:
+            matches = regex.findall(text)
             if matches:
                 entities[name] = matches[0] if len(matches) == 1 else matches
         
@@ -164,41 +272,44 @@ class VoiceCommandParser:
         groups = entities.get("matched_groups", [])
         
         if intent == "load_data" and len(groups) >= 3:
-            source = groups[2].strip()
-            return f'data.load("{source}")'
+            return _DSL_LOAD % groups[2].strip()
         
         elif intent == "calculate" and len(groups) >= 3:
-            func_map = {"sumę": "sum", "średnią": "avg", "ilość": "count", 
-                       "sum": "sum", "average": "avg", "count": "count"}
-            func = func_map.get(groups[1], "sum")
-            field = groups[2].strip()
-            return f'metrics.{func}("{field}")'
+            func = cls.FUNCTION_MAP.get(groups[1], "sum")
+            return _DSL_METRIC % (func, groups[2].strip())
         
         elif intent == "filter" and len(groups) >= 4:
-            condition = groups[3].strip()
-            return f'transform.filter({condition})'
+            return _DSL_FILTER % groups[3].strip()
         
         elif intent == "report":
             template = groups[2].strip() if len(groups) > 2 and groups[2] else "executive_summary"
-            return f'report.generate("{template}")'
+            return _DSL_REPORT % template
         
         elif intent == "forecast" and len(groups) >= 4:
-            periods = int(groups[2])
-            unit_map = {"dni": 1, "tygodni": 7, "miesięcy": 30,
-                       "days": 1, "weeks": 7, "months": 30}
-            multiplier = unit_map.get(groups[3], 1)
-            total_days = periods * multiplier
-            return f'forecast.predict({total_days})'
+            total_days = int(groups[2]) * cls.UNIT_DAYS.get(groups[3], 1)
+            return _DSL_FORECAST % total_days
         
         elif intent == "alert" and len(groups) >= 4:
             metric = groups[1].strip()
             op = "gt" if groups[2] in ["powyżej", "above"] else "lt"
             threshold = groups[3]
-            return f'alert.threshold("{metric}", "{op}", {threshold})'
+            return _DSL_ALERT % (metric, op, threshold)
         
         return None
 
 
+# Keyed on the exact text: entity extraction and raw_text keep the original casing.
+# Cached commands are shared; VoiceCommandParser.parse hands out copies.
+@lru_cache(maxsize=4096)
+def _parse_cached(parser_cls: type, text: str) -> VoiceCommand:
+    return parser_cls._parse_uncached(text)
+
+
+def _copy_entities(entities: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy an entities dict; values are strings or lists of strings"""
+    return {k: list(v) if isinstance(v, list) else v for k, v in entities.items()}
+
+
 class VoiceModule(BaseModule):
     """Voice module implementation"""
     
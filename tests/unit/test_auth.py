@@ -15,6 +15,9 @@ from api.auth import (
     _generate_token,
     _verify_token,
     _users_db,
+    _add_user,
+    UserRecord,
+    _find_user_by_email,
     create_demo_user,
 )
 
@@ -84,6 +87,9 @@ class TestTokenGeneration:
         assert _verify_token("notseparated") is None
         assert _verify_token("") is None
         assert _verify_token("..") is None
+        assert _verify_token(".") is None
+        assert _verify_token("payload.") is None
+        assert _verify_token("." + "0" * 32) is None
 
 
 class TestDemoUser:
@@ -135,6 +141,71 @@ class TestUserDatabase:
         
         assert test_id in _users_db
         assert _users_db[test_id]["email"] == "test@test.com"
+    
+    def test_find_user_by_email(self):
+        """Users added via _add_user should be found by email"""
+        _add_user(UserRecord(
+            id="indexed_user",
+            email="indexed@test.com",
+            name="Indexed User",
+            password_hash=_hash_password("testpass"),
+            points_balance=10
+        ))
+        
+        assert _find_user_by_email("indexed@test.com")["id"] == "indexed_user"
+        assert _find_user_by_email("missing@test.com") is None
+        
+        create_demo_user()
+        assert _find_user_by_email("demo@analytica.pl")["id"] == "demo_user_001"
+    
+    def test_find_user_stored_without_index(self):
+        """Users written directly into the database should be found by email"""
+        _users_db["direct_user"] = {
+            "id": "direct_user",
+            "email": "direct@test.com",
+            "name": "Direct User",
+            "password_hash": _hash_password("testpass"),
+            "points_balance": 0
+        }
+        
+        assert _find_user_by_email("direct@test.com")["id"] == "direct_user"
+        
+        _users_db["direct_user"]["email"] = "moved@test.com"
+        assert _find_user_by_email("direct@test.com") is None
+        assert _find_user_by_email("moved@test.com")["id"] == "direct_user"
+
+
+class TestUserRecord:
+    """Tests for the slotted user record"""
+    
+    def test_user_record_has_no_instance_dict(self):
+        """User records should use __slots__"""
+        create_demo_user()
+        demo = _users_db["demo_user_001"]
+        assert isinstance(demo, UserRecord)
+        assert not hasattr(demo, "__dict__")
+    
+    def test_user_record_dict_access(self):
+        """User records should support dict-style access"""
+        user = UserRecord(
+            id="record_user",
+            email="record@test.com",
+            name="Record User",
+            password_hash=_hash_password("testpass"),
+            points_balance=50
+        )
+        
+        user["points_balance"] += 25
+        user.setdefault("transactions", []).append({"type": "purchase", "amount": 25})
+        
+        assert user.points_balance == 75
+        assert user.get("company") is None
+        assert user.get("missing", "default") == "default"
+        assert len(user["transactions"]) == 1
+        assert user.to_dict()["email"] == "record@test.com"
+        
+        with pytest.raises(KeyError):
+            user["missing"]
 
 
 class TestPointsSystem:
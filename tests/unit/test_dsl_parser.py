@@ -101,6 +101,10 @@ class TestDSLTokenizer:
         
         # Comments should not appear in tokens
         assert all('comment' not in str(t).lower() for t in tokens)
+    
+    def test_tokenizers_share_compiled_regex(self):
+        """Test that the token regex is compiled once and reused"""
+        assert DSLTokenizer().regex is DSLTokenizer().regex
 
 
 # ============================================================
@@ -207,10 +211,126 @@ class TestDSLParser:
         with pytest.raises(SyntaxError):
             parse('data.load(')  # Missing closing paren
     
+    def test_parse_truncated_input_raises_error(self):
+        """Test that input ending mid-step raises SyntaxError"""
+        for dsl in ('data.', 'data.load("x") | metrics', 'metrics.calculate(["sum"'):
+            with pytest.raises(SyntaxError):
+                parse(dsl)
+    
     def test_parse_empty_string(self):
         """Test parsing empty string"""
         pipeline = parse('')
         assert len(pipeline.steps) == 0
+    
+    def test_parse_reuses_parser_between_calls(self):
+        """Test that consecutive parses with the shared parser do not leak state"""
+        first = parse('$year = 2024\ndata.load("sales") | metrics.sum("amount")')
+        second = parse('data.load("costs")')
+        
+        assert len(first.steps) == 2
+        assert len(second.steps) == 1
+        assert second.variables == {}
+        assert second.steps[0].atom.params == {"_arg0": "costs"}
+    
+    def test_parse_cached_result_is_not_shared(self):
+        """Test that mutating a parsed pipeline does not affect later parses"""
+        dsl = '$year = 2024\nmetrics.calculate(["sum", "avg"])'
+        first = parse(dsl)
+        first.variables["year"] = 1999
+        first.steps[0].atom.params["_arg0"].append("count")
+        first.steps.clear()
+        
+        second = parse(dsl)
+        assert second.variables["year"] == 2024
+        assert second.steps[0].atom.params["_arg0"] == ["sum", "avg"]
+    
+    def test_parse_copy_shares_only_immutable_values(self):
+        """Test that cached copies share scalars but not containers"""
+        dsl = 'view.chart(type="bar", series=["a", "b"], title="T") | transform.limit(5)'
+        first, second = parse(dsl), parse(dsl)
+        
+        assert first.steps[0].atom.params is not second.steps[0].atom.params
+        assert first.steps[0].atom.params["series"] is not second.steps[0].atom.params["series"]
+        assert first.steps[0].atom.params == second.steps[0].atom.params
+        assert first.steps[1].atom.params == {"_arg0": 5}
+    
+    def test_parse_simple_step_matches_full_parser(self):
+        """Test that the single-step fast path agrees with DSLParser"""
+        for dsl in ('data.load("sales.csv")', ' metrics.count() ', 'transform.limit(10)', 'custom.run("x")'):
+            assert parse(dsl).to_dict() == DSLParser().parse(dsl).to_dict()
+    
+    def test_execute_string_reuses_cached_definition(self):
+        """Test that executing DSL text twice parses it only once"""
+        from dsl.core.parser import _parse_cached, _compile_cached
+        
+        dsl = 'data.from_input() | transform.limit(2)'
+        _parse_cached.cache_clear()
+        _compile_cached.cache_clear()
+        for _ in range(2):
+            ctx = PipelineContext()
+            ctx.set_data([{"v": 1}, {"v": 2}, {"v": 3}])
+            result = execute('  ' + dsl + '\n', context=ctx)
+            assert result.get_data() == [{"v": 1}, {"v": 2}]
+        
+        assert _parse_cached.cache_info().misses == 1
+        info = _compile_cached.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+    
+    def test_cached_variables_are_copied_per_run(self):
+        """Test that mutating run variables does not leak into the parse cache"""
+        from dsl.core.parser import _parse_cached
+        from dsl.core.executor import PipelineExecutor as HookedExecutor
+        
+        dsl = '$rows = [1, 2]\nmetrics.count()'
+        for run in (lambda ctx: execute(dsl, context=ctx),
+                    lambda ctx: HookedExecutor(ctx).execute(dsl)):
+            ctx = PipelineContext()
+            ctx.set_data([{"x": 1}])
+            run(ctx)
+            ctx.variables["rows"].append(3)
+        
+        assert _parse_cached(dsl).variables["rows"] == [1, 2]
+        fresh = PipelineContext()
+        fresh.set_data([{"x": 1}])
+        assert execute(dsl, context=fresh).variables["rows"] == [1, 2]
+    
+    def test_compiled_pipeline_runs_on_many_contexts(self):
+        """Test that a compiled pipeline resolves variables per context"""
+        from dsl.core.parser import PipelineExecutor
+        
+        run = PipelineExecutor().compile('$n = 1\ndata.from_input() | transform.limit($n)')
+        for rows in ([{"v": 1}, {"v": 2}], [{"v": 3}]):
+            ctx = PipelineContext()
+            ctx.set_data(rows)
+            assert run(ctx) is ctx
+            assert ctx.get_data() == rows[:1]
+            assert ctx.logs[-1]["message"].startswith("Executing: transform.limit(")
+    
+    def test_metrics_calculate_shares_total(self):
+        """Test that sum and avg agree when computed together or alone"""
+        ctx = PipelineContext()
+        ctx.set_data([{"amount": 1}, {"amount": 2}, {"amount": 4.5}])
+        
+        both = metrics_calculate(ctx, ["sum", "avg", "count"], field="amount")
+        assert both == {"sum": 7.5, "avg": 2.5, "count": 3}
+        assert metrics_calculate(ctx, ["avg"], field="amount") == {"avg": 2.5}
+        assert metrics_calculate(ctx, ["sum", "avg"], field="missing") == {"sum": 0.0, "avg": 0.0}
+        
+        ctx.set_data([])
+        assert metrics_calculate(ctx, ["sum", "avg"]) == {"sum": 0, "avg": 0}
+    
+    def test_metrics_over_rows(self):
+        """Test that field metrics count rows missing the field as 0"""
+        from dsl.atoms.implementations import _extract_values
+        
+        rows = [{"v": 3}, {"v": 1.5}, {"w": 9}, {"v": "2"}]
+        ctx = PipelineContext()
+        ctx.set_data(rows)
+        
+        assert metrics_sum(ctx, "v") == sum(_extract_values(rows, "v")) == 6.5
+        assert metrics_avg(ctx, "v") == 1.625
+        assert metrics_percentile(ctx, "v", p=50) == 2.0
+        assert metrics_calculate(ctx, ["count", "max"], field="missing") == {"count": 4, "max": 0.0}
 
 
 # ============================================================
@@ -363,6 +483,14 @@ class TestAtom:
         assert atom.action == "load"
         assert atom.params["source"] == "file.csv"
     
+    def test_atom_uses_slots(self):
+        """Test that atoms have no per-instance dict and share action strings"""
+        a = Atom(type=AtomType.DATA, action="".join(["lo", "ad"]))
+        b = Atom(type=AtomType.DATA, action="load")
+        
+        assert not hasattr(a, "__dict__")
+        assert a.action is b.action
+    
     def test_atom_to_dsl(self):
         """Test atom DSL conversion"""
         atom = Atom(
@@ -375,6 +503,13 @@ class TestAtom:
         assert "metrics.sum" in dsl
         assert "amount" in dsl
     
+    def test_atom_to_dsl_exact(self):
+        """Test exact atom DSL output for mixed params"""
+        atom = Atom(type=AtomType.TRANSFORM, action="filter", params={"year": 2024, "status": "active"})
+        
+        assert atom.to_dsl() == "transform.filter(year=2024, status='active')"
+        assert Atom(type=AtomType.METRICS, action="count").to_dsl() == "metrics.count()"
+    
     def test_atom_to_dict(self):
         """Test atom dict conversion"""
         atom = Atom(
@@ -399,6 +534,21 @@ class TestAtom:
         atom = Atom.from_dict(d)
         assert atom.type == AtomType.DATA
         assert atom.action == "load"
+    
+    def test_atom_from_dict_unknown_type(self):
+        """Test that an unknown atom type is rejected"""
+        assert Atom.from_dict({"type": AtomType.VIEW, "action": "chart"}).type == AtomType.VIEW
+        with pytest.raises(ValueError):
+            Atom.from_dict({"type": "nonexistent", "action": "load"})
+    
+    def test_atom_from_dict_round_trip(self):
+        """Test that from_dict rebuilds an equal atom"""
+        atom = Atom(type=AtomType.METRICS, action="sum", params={"field": "amount"})
+        restored = Atom.from_dict(atom.to_dict())
+        
+        assert restored == atom
+        assert restored.action is atom.action
+        assert Atom.from_dict({"type": "data", "action": "load"}).params == {}
 
 
 # ============================================================
@@ -451,6 +601,23 @@ class TestPipelineContext:
         assert resolved["name"] == "test"
         assert resolved["static"] == 100
     
+    def test_context_resolve_params_nested_and_embedded(self):
+        """Test resolving variables inside strings, lists and nested dicts"""
+        ctx = PipelineContext(variables={"year": 2024, "name": "test"})
+        
+        params = {
+            "title": "Report ${name} for $year",
+            "filters": [{"year": "$year"}, "$name", 5],
+            "price": "10$",
+        }
+        resolved = ctx.resolve_params(params)
+        
+        assert resolved["title"] == "Report test for 2024"
+        assert resolved["filters"] == [{"year": 2024}, "test", 5]
+        assert resolved["price"] == "10$"
+        with pytest.raises(ValueError):
+            ctx.resolve_params({"x": "Hello $missing"})
+    
     def test_context_logging(self):
         """Test context logging"""
         ctx = PipelineContext()
@@ -460,6 +627,48 @@ class TestPipelineContext:
         
         assert len(ctx.logs) == 2
         assert ctx.logs[0]["message"] == "Test message"
+    
+    def test_context_log_entry_fields(self):
+        """Test that log entries expose level, message, timestamp and step"""
+        ctx = PipelineContext()
+        ctx.increment_step()
+        ctx.error("Boom")
+        
+        entry = ctx.logs[0]
+        assert entry["level"] == "error"
+        assert entry["message"] == "ERROR: Boom"
+        assert entry["step"] == 1
+        assert isinstance(entry["timestamp"], str)
+        assert ctx.to_dict()["log_count"] == 1
+    
+    def test_context_logs_list_is_mutable(self):
+        """Test that logs can be passed in, appended to, cleared and replaced"""
+        seed = [{"level": "info", "message": "seeded", "timestamp": "", "step": 0}]
+        ctx = PipelineContext(logs=seed)
+        ctx.log("first")
+        ctx.logs.append({"level": "info", "message": "manual", "timestamp": "", "step": 0})
+        ctx.log("second")
+        
+        assert [e["message"] for e in ctx.logs] == ["seeded", "first", "manual", "second"]
+        assert ctx.logs is seed
+        
+        ctx.log("pending")
+        ctx.logs.clear()
+        assert ctx.logs == []
+        assert ctx.to_dict()["log_count"] == 0
+        
+        ctx.log("dropped")
+        ctx.logs = []
+        ctx.log("kept")
+        assert [e["message"] for e in ctx.logs] == ["kept"]
+        assert PipelineContext().logs == []
+    
+    def test_context_uses_slots(self):
+        """Test that contexts have no per-instance __dict__"""
+        ctx = PipelineContext()
+        
+        assert not hasattr(ctx, "__dict__")
+        assert ctx.clone().variables == {}
 
 
 # ============================================================
@@ -492,6 +701,21 @@ class TestPipelineDefinition:
         assert len(d["steps"]) == 2
         assert d["variables"]["v"] == 1
     
+    def test_definition_dict_access(self):
+        """Test dict-style access matches to_dict()"""
+        from dsl.core.parser import PipelineStep
+        
+        steps = [PipelineStep(atom=Atom(AtomType.DATA, "load", {"source": "x"}))]
+        definition = PipelineDefinition(name="test", steps=steps, variables={"v": 1})
+        expected = definition.to_dict()
+        
+        for key in expected:
+            assert key in definition
+            assert definition[key] == expected[key]
+        assert "missing" not in definition
+        with pytest.raises(KeyError):
+            definition["missing"]
+    
     def test_definition_to_yaml(self):
         """Test definition YAML conversion"""
         from dsl.core.parser import PipelineStep
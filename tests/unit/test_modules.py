@@ -13,6 +13,8 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
+from modules.voice import VoiceCommandParser
+
 
 # ============================================================
 # BUDGET MODULE TESTS
@@ -96,6 +98,24 @@ class TestBudgetModule:
         assert len(result["it"]) == 1
         assert len(result["other"]) == 1
     
+    def test_budget_categorize_expenses_rule_order(self):
+        """Test that the first matching rule wins and keywords are literal"""
+        from modules.budget import BudgetCalculator
+        
+        rules = {"travel": ["hotel"], "events": ["hotel", "c++"], "empty": []}
+        expenses = [
+            {"description": "Hotel for conference"},
+            {"description": "C++ workshop"},
+            {"description": "Coffee"},
+        ]
+        
+        result = BudgetCalculator.categorize_expenses(expenses, rules)
+        
+        assert result["travel"] == [expenses[0]]
+        assert result["events"] == [expenses[1]]
+        assert result["empty"] == []
+        assert result["other"] == [expenses[2]]
+    
     def test_budget_project_spending(self):
         """Test spending projection"""
         from modules.budget import BudgetCalculator
@@ -108,6 +128,17 @@ class TestBudgetModule:
         
         assert result["daily_rate"] == 2000.0
         assert result["projected_total"] == 60000.0
+    
+    def test_budget_float_mode_matches_precise(self):
+        """Test that precise=False gives the same figures for plain amounts"""
+        from modules.budget import BudgetCalculator
+        
+        precise = BudgetCalculator.calculate_variance(Decimal("100000"), Decimal("120000"))
+        fast = BudgetCalculator.calculate_variance(100000.0, 120000.0, precise=False)
+        mixed = BudgetCalculator.calculate_variance(100000.0, Decimal("120000"))
+        
+        assert fast == precise == mixed
+        assert BudgetCalculator.project_spending(30000.0, 15, 30, precise=False)["projected_total"] == 60000.0
 
 
 # ============================================================
@@ -179,6 +210,17 @@ class TestInvestmentModule:
         assert irr is not None
         assert irr > 0
     
+    def test_irr_without_root_returns_none(self):
+        """Test IRR for flows that never break even"""
+        from modules.investment import InvestmentCalculator
+        
+        irr = InvestmentCalculator.calculate_irr(
+            initial_investment=Decimal("100000"),
+            cash_flows=[Decimal("-5000")] * 10
+        )
+        
+        assert irr is None
+    
     def test_payback_period(self):
         """Test payback period calculation"""
         from modules.investment import InvestmentCalculator
@@ -191,6 +233,17 @@ class TestInvestmentModule:
         assert result["payback_period"] == 2.5
         assert result["recovered"] == True
     
+    def test_float_mode_matches_precise(self):
+        """Test that precise=False gives the same figures for plain amounts"""
+        from modules.investment import InvestmentCalculator
+        
+        flows = [Decimal("40000"), Decimal("40000"), Decimal("40000")]
+        precise = InvestmentCalculator.calculate_payback_period(Decimal("100000"), flows)
+        fast = InvestmentCalculator.calculate_payback_period(100000.0, [float(cf) for cf in flows], precise=False)
+        
+        assert fast == precise
+        assert InvestmentCalculator.calculate_roi(100000.0, 150000.0, precise=False)["roi_percent"] == 50.0
+    
     def test_payback_not_recovered(self):
         """Test payback when investment not recovered"""
         from modules.investment import InvestmentCalculator
@@ -331,6 +384,26 @@ class TestForecastModule:
         assert "mape" in metrics
         assert "rmse" in metrics
         assert metrics["mae"] > 0
+    
+    def test_forecast_accuracy_zero_actual(self):
+        """Test that zero actuals are excluded from percentage error"""
+        from modules.forecast import ForecastCalculator
+        
+        metrics = ForecastCalculator.calculate_accuracy([0.0, 100.0], [10.0, 90.0])
+        
+        assert metrics == {"mae": 10.0, "mape": 5.0, "rmse": 10.0}
+    
+    def test_forecast_import_defers_numpy(self):
+        """Test that importing the module does not load numpy up front"""
+        import subprocess
+        
+        src = str(Path(__file__).parent.parent.parent / "src")
+        code = "import sys; import modules.forecast, modules.alerts; print('numpy' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=src, capture_output=True, text=True, check=True
+        )
+        
+        assert result.stdout.strip() == "False"
 
 
 # ============================================================
@@ -354,6 +427,21 @@ class TestReportsModule:
         assert "Test Report" in html
         assert "summary" in html.lower()
     
+    def test_generate_html_report_sections(self):
+        """Test HTML rendering of table, list and scalar sections"""
+        from modules.reports import ReportGenerator
+        
+        html = ReportGenerator.generate_html(
+            title="Test Report",
+            data={"rows": [{"a": 1, "b": 2}], "items": ["x"], "total": 5},
+        )
+        
+        assert "<title>Test Report</title>" in html
+        assert "<tr><th>a</th><th>b</th></tr>\n        <tr><td>1</td><td>2</td></tr>" in html
+        assert "<li>x</li>" in html
+        assert "<p class='metric'>5</p>" in html
+        assert html.endswith("</body>\n</html>")
+    
     def test_generate_json_report(self):
         """Test JSON report generation"""
         from modules.reports import ReportGenerator
@@ -368,6 +456,51 @@ class TestReportsModule:
         assert parsed["title"] == "Test Report"
         assert parsed["data"]["value"] == 123
     
+    def test_generate_json_report_non_json_types(self):
+        """Test that Decimal, non-string keys and big ints are serialized"""
+        from modules.reports import ReportGenerator
+        import json
+        
+        result = ReportGenerator.generate_json(
+            title="Test Report",
+            data={"amount": Decimal("10.50"), 2024: "year", "big": 2 ** 70}
+        )
+        
+        parsed = json.loads(result)
+        assert parsed["data"]["amount"] == "10.50"
+        assert parsed["data"]["2024"] == "year"
+        assert parsed["data"]["big"] == 2 ** 70
+    
+    def test_generate_json_report_matches_stdlib_output(self):
+        """Test that report JSON is byte-identical to json.dumps(indent=2, default=str)"""
+        from dataclasses import dataclass as make_dataclass
+        from modules.reports import ReportFormat, _dumps
+        import json
+        import numpy as np
+        
+        @make_dataclass
+        class Point:
+            x: int
+        
+        payloads = [
+            {"when": datetime(2024, 1, 2, 3, 4, 5), "day": date(2024, 1, 2), "amount": Decimal("1.50")},
+            {"name": "zażółć \u2028 \x7f \U0001f600", 7: [1, 2.5, -0.0, 1e16, None, True], "empty": {}},
+            {"format": ReportFormat.PDF, "point": Point(1)},
+            {"ratio": float("nan"), "limit": float("inf")},
+            {"tiny": 1e-07, "small": 9.999999e-05},
+            {"values": np.array([1, 2]), "mean": np.float64(1.5), "count": np.int64(3)},
+            {"big": 2 ** 70, 2 ** 65: "key"},
+        ]
+        for payload in payloads:
+            assert _dumps(payload) == json.dumps(payload, indent=2, default=str)
+    
+    def test_generate_html_report_non_str_title(self):
+        """Test that non-string titles are rendered like before"""
+        from modules.reports import ReportGenerator
+        
+        assert "<title>2024</title>" in ReportGenerator.generate_html(2024, {"total": 1})
+        assert "<h1>None</h1>" in ReportGenerator.generate_html(None, {})
+    
     def test_generate_csv_report(self):
         """Test CSV report generation"""
         from modules.reports import ReportGenerator
@@ -382,6 +515,19 @@ class TestReportsModule:
         
         assert len(lines) == 3  # header + 2 rows
         assert "name,value" in lines[0]
+    
+    def test_generate_csv_quotes_values(self):
+        """Test that CSV values with separators are quoted"""
+        from modules.reports import ReportGenerator
+        import io
+        
+        data = [{"name": "Smith, John", "value": 100}, {"name": "Doe", "extra": 1}]
+        
+        assert ReportGenerator.generate_csv(data) == 'name,value\n"Smith, John",100\nDoe,'
+        
+        buffer = io.StringIO()
+        ReportGenerator.generate_csv_stream(data, buffer)
+        assert buffer.getvalue() == ReportGenerator.generate_csv(data) + "\n"
 
 
 # ============================================================
@@ -425,6 +571,15 @@ class TestAlertsModule:
         assert rule.evaluate(100.0) == False
         assert rule.evaluate(150.0) == False
     
+    def test_alert_rule_evaluate_all_operators(self):
+        """Test every comparison operator at the threshold boundary"""
+        from modules.alerts import AlertRule, ComparisonOperator
+        
+        expected = {"gt": False, "gte": True, "lt": False, "lte": True, "eq": True, "neq": False}
+        for op in ComparisonOperator:
+            rule = AlertRule(id="t", name="t", metric="value", operator=op, threshold=100.0)
+            assert rule.evaluate(100.0) == expected[op.value]
+    
     def test_check_threshold(self):
         """Test threshold checking"""
         from modules.alerts import AlertEngine
@@ -463,6 +618,21 @@ class TestAlertsModule:
         )
         
         assert result["is_anomaly"] == False
+    
+    def test_detect_anomaly_rolling_stats(self):
+        """Test streaming anomaly detection with running statistics"""
+        from modules.alerts import AlertEngine, RollingStats
+        import statistics
+        
+        values = [100.0, 102.0, 98.0, 101.0, 99.0]
+        stats = RollingStats()
+        for value in values:
+            stats.update(value)
+        
+        assert stats.mean == pytest.approx(statistics.mean(values))
+        assert stats.std == pytest.approx(statistics.stdev(values))
+        assert AlertEngine.detect_anomaly(stats, 150.0) == AlertEngine.detect_anomaly(values, 150.0)
+        assert AlertEngine.detect_anomaly(RollingStats([1.0]), 150.0)["is_anomaly"] == False
 
 
 # ============================================================
@@ -474,8 +644,6 @@ class TestVoiceModule:
     
     def test_parse_calculate_command_pl(self):
         """Test Polish calculate command parsing"""
-        from modules.voice import VoiceCommandParser
-        
         command = VoiceCommandParser.parse("oblicz sumę sprzedaży")
         
         assert command.intent == "calculate"
@@ -484,8 +652,6 @@ class TestVoiceModule:
     
     def test_parse_load_command_pl(self):
         """Test Polish load command parsing"""
-        from modules.voice import VoiceCommandParser
-        
         command = VoiceCommandParser.parse("załaduj dane sales.csv")
         
         assert command.intent == "load_data"
@@ -494,8 +660,6 @@ class TestVoiceModule:
     
     def test_parse_report_command_pl(self):
         """Test Polish report command parsing"""
-        from modules.voice import VoiceCommandParser
-        
         command = VoiceCommandParser.parse("wygeneruj raport miesięczny")
         
         assert command.intent == "report"
@@ -504,8 +668,6 @@ class TestVoiceModule:
     
     def test_parse_unknown_command(self):
         """Test unknown command handling"""
-        from modules.voice import VoiceCommandParser
-        
         command = VoiceCommandParser.parse("random text that doesn't match")
         
         assert command.intent == "unknown"
@@ -514,10 +676,84 @@ class TestVoiceModule:
     
     def test_parse_forecast_command(self):
         """Test forecast command parsing"""
-        from modules.voice import VoiceCommandParser
-        
         command = VoiceCommandParser.parse("prognozuj sprzedaż na 30 dni")
         
         assert command.intent == "forecast"
         assert command.dsl is not None
         assert "forecast.predict" in command.dsl
+    
+    def test_parse_alert_command_en(self):
+        """Test English alert command parsing with entity extraction"""
+        command = VoiceCommandParser.parse("Set alert revenue above 5000")
+        
+        assert command.intent == "alert"
+        assert command.dsl == 'alert.threshold("revenue", "gt", 5000)'
+        assert command.entities["number"] == "5000"
+    
+    def test_parse_shared_trigger_word(self):
+        """Test that a trigger shared by several intents still resolves correctly"""
+        assert VoiceCommandParser.parse("stwórz alert koszty poniżej 100").intent == "alert"
+        assert VoiceCommandParser.parse("stwórz raport kwartalny").intent == "report"
+    
+    def test_voice_command_is_slotted(self):
+        """Test that parsed commands are slotted records"""
+        command = VoiceCommandParser.parse("prognozuj sprzedaż na 30 dni")
+        
+        assert not hasattr(command, "__dict__")
+        with pytest.raises(AttributeError):
+            command.extra = "other"
+    
+    def test_parse_cached_per_utterance(self):
+        """Test that repeated utterances are cached but returned as copies"""
+        from modules.voice import _parse_cached
+        
+        _parse_cached.cache_clear()
+        first = VoiceCommandParser.parse("Set alert revenue above 5000")
+        first.entities["matched_groups"].append("mutated")
+        first.entities["extra"] = "mutated"
+        
+        second = VoiceCommandParser.parse("Set alert revenue above 5000")
+        assert second is not first
+        assert "mutated" not in second.entities["matched_groups"]
+        assert "extra" not in second.entities
+        assert _parse_cached.cache_info().hits == 1
+        assert VoiceCommandParser.parse("set alert revenue above 5000").raw_text == "set alert revenue above 5000"
+    
+    def test_subclass_patterns_are_compiled(self):
+        """Test that a subclass's own intent and entity patterns are used"""
+        class TableParser(VoiceCommandParser):
+            INTENT_PATTERNS = {"load_data": [r"(załaduj)\s+(tabelę)\s+(.+)"]}
+            ENTITY_PATTERNS = {"table": r"tabelę\s+(\w+)"}
+        
+        command = TableParser.parse("załaduj tabelę klienci")
+        assert command.dsl == 'data.load("klienci")'
+        assert command.entities["table"] == "klienci"
+        assert VoiceCommandParser.parse("załaduj tabelę klienci").intent == "unknown"
+    
+    def test_subclass_trigger_words_are_indexed(self):
+        """Test that intents started by a subclass's new trigger words are tried"""
+        class ImportParser(VoiceCommandParser):
+            INTENT_PATTERNS = {"load_data": [r"(importuj)\s+(dane)\s+(.+)"]}
+        
+        assert ImportParser.parse("importuj dane sales.csv").dsl == 'data.load("sales.csv")'
+        assert ImportParser.parse("załaduj dane sales.csv").intent == "unknown"
+    
+    def test_subclass_trigger_groups_with_case_and_metacharacters(self):
+        """Test that subclass patterns the trigger index cannot index are still tried"""
+        class CustomParser(VoiceCommandParser):
+            INTENT_PATTERNS = {
+                "load_data": [r"(Załaduj|Load)\s+(data)\s+(.+)"],
+                "calculate": [r"(poli[cz]z)\s+(sumę)\s+(.+)"],
+                "report": [r"(pełny)?\s*(raport)\s*(.+)?"],
+            }
+        
+        assert CustomParser.parse("Załaduj data sales.csv").dsl == 'data.load("sales.csv")'
+        assert CustomParser.parse("polizz sumę kwota").dsl == 'metrics.sum("kwota")'
+        assert CustomParser.parse("raport roczny").intent == "report"
+    
+    def test_generated_dsl_templates(self):
+        """Test the DSL generated for each intent"""
+        assert VoiceCommandParser.parse("oblicz średnią cena").dsl == 'metrics.avg("cena")'
+        assert VoiceCommandParser.parse("załaduj dane sales.csv").dsl == 'data.load("sales.csv")'
+        assert VoiceCommandParser.parse("wygeneruj raport").dsl == 'report.generate("executive_summary")'
+        assert VoiceCommandParser.parse("prognozuj sprzedaż na 3 tygodni").dsl == "forecast.predict(21)"
@@ -55,6 +55,20 @@ class TestViewChart:
         
         assert result["views"][0]["chart_type"] == "pie"
     
+    def test_chart_type_from_dsl_is_shared_constant(self):
+        """Test that parsed chart types map onto one interned string"""
+        parser = DSLParser()
+        specs = []
+        for title in ("A", "B"):
+            ctx = PipelineContext()
+            ctx.set_data([1, 2])
+            executor = PipelineExecutor(ctx)
+            executor.execute(parser.parse(f'view.chart(type="line", title="{title}")'))
+            specs.append(ctx.get_data()["views"][0])
+        
+        assert specs[0]["chart_type"] == "line"
+        assert specs[0]["chart_type"] is specs[1]["chart_type"]
+    
     def test_chart_with_series(self):
         """Test chart with multiple series"""
         ctx = PipelineContext()
@@ -66,6 +80,19 @@ class TestViewChart:
         result = implementations.view_chart(ctx, type="bar", x="month", series=["sales", "costs"])
         
         assert result["views"][0]["series"] == ["sales", "costs"]
+    
+    def test_chart_data_path_only_when_set(self):
+        """Test that data_path is emitted only for a non-empty path"""
+        ctx = PipelineContext()
+        ctx.set_data({"rows": [1, 2]})
+        
+        with_path = implementations.view_chart(ctx, type="bar", dataPath="rows")
+        ctx.set_data({"rows": [1, 2]})
+        without_path = implementations.view_chart(ctx, type="bar", data_path="")
+        
+        assert with_path["views"][0]["data_path"] == "rows"
+        assert list(with_path["views"][0])[-1] == "data_path"
+        assert "data_path" not in without_path["views"][0]
 
 
 class TestViewTable:
@@ -99,6 +126,20 @@ class TestViewTable:
         assert len(result["views"][0]["columns"]) == 3
         assert result["views"][0]["columns"][0]["field"] == "id"
     
+    def test_table_auto_columns_union_of_sampled_rows(self):
+        """Test auto-detected columns include keys missing from the first row"""
+        ctx = PipelineContext()
+        ctx.set_data([
+            {"id": 1, "name": "Test"},
+            {"id": 2, "unit_price": 9.5},
+        ] + [{"id": n} for n in range(3, 40)] + [{"late_key": 1}])
+        
+        result = implementations.view_table(ctx)
+        
+        columns = result["views"][0]["columns"]
+        assert [c["field"] for c in columns] == ["id", "name", "unit_price"]
+        assert columns[2]["header"] == "Unit Price"
+    
     def test_table_with_options(self):
         """Test table with sorting and pagination options"""
         ctx = PipelineContext()
@@ -212,6 +253,34 @@ class TestViewDashboard:
         result = implementations.view_dashboard(ctx, refresh=30)
         
         assert result["views"][0]["refresh_interval"] == 30
+    
+    def test_dashboard_children_built_in_one_call(self):
+        """Test dashboard children become full widget specs"""
+        ctx = PipelineContext()
+        ctx.set_data([{"month": "Jan", "sales": 100, "costs": 80}])
+        executor = PipelineExecutor(ctx)
+        
+        executor.execute(
+            'view.dashboard(title="Sales", widgets=["legacy"], children=['
+            '{"view": "card", "value": "sales", "format": "currency"}, '
+            '{"view": "chart", "type": "line", "x": "month", "y": "sales"}, '
+            '{"view": "table"}])'
+        )
+        
+        widgets = ctx.get_data()["views"][0]["widgets"]
+        assert widgets[0] == "legacy"
+        assert [w["type"] for w in widgets[1:]] == ["card", "chart", "table"]
+        assert widgets[1]["value_field"] == "sales"
+        assert widgets[2]["chart_type"] == "line"
+        assert [c["field"] for c in widgets[3]["columns"]] == ["month", "sales", "costs"]
+    
+    def test_dashboard_rejects_unknown_child(self):
+        """Test that a child without a known view type is an error"""
+        ctx = PipelineContext()
+        ctx.set_data({})
+        
+        with pytest.raises(ValueError):
+            implementations.view_dashboard(ctx, children=[{"type": "card"}])
 
 
 class TestViewText:
@@ -289,6 +358,20 @@ class TestMultipleViews:
         result = implementations.view_table(ctx)
         
         assert result["data"] == original_data
+    
+    def test_chained_views_share_one_list(self):
+        """Test that each chained view appends to the existing views list"""
+        ctx = PipelineContext()
+        ctx.set_data([{"a": 1}])
+        
+        result = implementations.view_chart(ctx, type="bar")
+        views = result["views"]
+        for _ in range(10):
+            ctx.set_data(result)
+            result = implementations.view_card(ctx, value="a")
+        
+        assert result["views"] is views
+        assert len(views) == 11
 
 
 class TestViewDSLPipeline:
@@ -364,6 +447,18 @@ class TestViewDSLPipeline:
         assert "views" in result
         assert result["views"][0]["type"] == "card"
         assert result["views"][0]["icon"] == "💰"
+    
+    def test_execute_trivial_pipeline_without_parser(self):
+        """Test that executing DSL text never builds the executor's own parser"""
+        ctx = PipelineContext()
+        ctx.set_data([{"name": "A", "value": 10}])
+        executor = PipelineExecutor(ctx)
+        
+        executor.execute('data.from_input() | view.chart(type="bar", x="name", y="value")')
+        
+        assert executor._parser is None
+        assert ctx.get_data()["views"][0]["chart_type"] == "bar"
+        assert isinstance(executor.parser, DSLParser)
 
 
 class TestViewAtomRegistration:
@@ -389,3 +484,58 @@ class TestViewAtomRegistration:
         assert dashboard_atom is not None
         assert text_atom is not None
         assert list_atom is not None
+    
+    def test_registry_get_matches_listing(self):
+        """Test that flat lookup agrees with the grouped listing"""
+        for atom_type, actions in AtomRegistry.list_atoms().items():
+            for action in actions:
+                assert AtomRegistry.get(atom_type, action) is AtomRegistry._handlers[atom_type][action]
+        
+        assert AtomRegistry.get("view", "missing") is None
+        assert AtomRegistry.get("missing", "chart") is None
+    
+    def test_atom_params_maps_positional_and_validates(self):
+        """Test atom_params positional mapping, defaults and validation"""
+        from dsl.core.registry import atom_params, Required, Optional_, OneOf, ParamType
+        
+        @atom_params(
+            source=Required(ParamType.STRING),
+            fmt=Optional_(str, default="auto"),
+            mode=OneOf(["fast", "full"]),
+        )
+        def load(ctx, **kwargs):
+            return kwargs
+        
+        assert load(None, _arg0="a.csv", _arg1="extra", mode="fast") == {
+            "source": "a.csv", "mode": "fast", "fmt": "auto"
+        }
+        assert load(None, source="b.csv", _arg0="ignored", mode="full")["source"] == "b.csv"
+        
+        with pytest.raises(ValueError, match="source.*mode"):
+            load(None, source=5, mode="slow")
+    
+    def test_api_response_matches_json_response(self):
+        """Test the API response class renders like starlette's JSONResponse"""
+        from datetime import datetime
+        from fastapi.responses import JSONResponse
+        from dsl.api.responses import FastJSONResponse
+        
+        payloads = [
+            {"views": [{"type": "chart", "data": [1, 2.5, -3]}], "name": "zażółć \u2028"},
+            {"data": [{"a": None, "b": True}], "count": 2 ** 70},
+            {"by_id": {1: "a", 2.5: "b", None: "c"}},
+            {"tiny": 1e-07, "rows": [{"note": None, "text": "null"}] * 3},
+            [],
+        ]
+        for payload in payloads:
+            assert FastJSONResponse(payload).body == JSONResponse(payload).body
+        
+        # Plain payloads with None values stay on the orjson path
+        from dsl.api.responses import _orjson_matches_json
+        assert _orjson_matches_json({"rows": [{"note": None, "amount": 1.25}]})
+        
+        for payload in ({"ratio": float("nan")}, {"at": datetime(2024, 1, 1)}):
+            with pytest.raises((TypeError, ValueError)):
+                JSONResponse(payload)
+            with pytest.raises((TypeError, ValueError)):
+                FastJSONResponse(payload)